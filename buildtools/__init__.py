@@ -0,0 +1,18 @@
+"""Helpers of the BuildTools runner (main_buildtools_runner.py)."""
+
+from .cache import BuildCache, file_sha256
+from .instrumentation import run_instrumented
+from .jdks import discover_jdks, match_jdk
+from .matrix import build_matrix
+from .report import print_comparison, write_run_report
+
+__all__ = [
+    "BuildCache",
+    "build_matrix",
+    "discover_jdks",
+    "file_sha256",
+    "match_jdk",
+    "print_comparison",
+    "run_instrumented",
+    "write_run_report",
+]
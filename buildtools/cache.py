@@ -0,0 +1,169 @@
+"""Content-addressed cache of the jars built by BuildTools, safe to share between build hosts."""
+
+# pylint: disable=C0301
+
+import hashlib
+import json
+import os
+import shutil
+import socket
+import threading
+import time
+
+
+def file_sha256(path: str) -> str:
+    """
+    Hashes a file without reading it into memory at once.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        str: The hex digest of the content.
+    """
+    digest = hashlib.sha256()
+    with open(file=path, mode="rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _write_atomically(path: str, write):
+    """Writes a file under a temporary name first, so readers on other hosts never see half of it."""
+    temporary_path = f"{path}.{socket.gethostname()}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(temporary_path)
+        os.replace(temporary_path, path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+
+class BuildCache:
+    """
+    Jars stored under the hash of their content in objects/, plus one index entry per build key in index/.
+
+    Every entry is written to its own file with an atomic rename, so several hosts can share the
+    directory (e.g. over NFS) without locking.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Opens the cache, creating its directories if needed.
+
+        Args:
+            directory (str): The cache directory, may be shared by several hosts.
+        """
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, "objects")
+        self.index_dir = os.path.join(directory, "index")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.index_dir, exist_ok=True)
+
+    @staticmethod
+    def key(
+        version: str, compile_type: str, buildtools_sha256: str, jdk_version: str
+    ) -> str:
+        """
+        Returns the key of a build, which changes whenever anything influencing its jar changes.
+
+        Args:
+            version (str): The minecraft version.
+            compile_type (str): The compiled target (e.g. spigot).
+            buildtools_sha256 (str): The hash of the BuildTools.jar.
+            jdk_version (str): The full version of the JDK running BuildTools.
+
+        Returns:
+            str: The key.
+        """
+        fields = [version, compile_type, buildtools_sha256, jdk_version]
+        return hashlib.sha256(json.dumps(fields).encode("utf-8")).hexdigest()
+
+    def _object_path(self, sha256: str) -> str:
+        return os.path.join(self.objects_dir, sha256[:2], f"{sha256}.jar")
+
+    def _index_path(self, key: str) -> str:
+        return os.path.join(self.index_dir, f"{key}.json")
+
+    def lookup(self, key: str) -> dict:
+        """
+        Returns the index entry of a build if its jar is in the cache.
+
+        Args:
+            key (str): The key of the build.
+
+        Returns:
+            dict: The index entry or None on a cache miss.
+        """
+        try:
+            with open(file=self._index_path(key), mode="r", encoding="utf-8") as index_file:
+                entry = json.load(index_file)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if not os.path.exists(self._object_path(entry["sha256"])):
+            return None
+
+        return entry
+
+    def restore(self, key: str, output_dir: str) -> bool:
+        """
+        Copies the cached jar of a build into the output directory.
+
+        Args:
+            key (str): The key of the build.
+            output_dir (str): The directory the jar is copied to under its original name.
+
+        Returns:
+            bool: True on a cache hit.
+        """
+        entry = self.lookup(key)
+        if entry is None:
+            return False
+
+        target_path = os.path.join(output_dir, entry["name"])
+        if not os.path.exists(target_path) or file_sha256(target_path) != entry["sha256"]:
+            _write_atomically(
+                target_path,
+                lambda path: shutil.copyfile(self._object_path(entry["sha256"]), path),
+            )
+
+        return True
+
+    def store(self, key: str, jar_path: str, **fields) -> dict:
+        """
+        Stores a built jar under its content hash and indexes it under the key of the build.
+
+        Args:
+            key (str): The key of the build.
+            jar_path (str): The path of the built jar.
+            **fields: Describing fields of the build kept in the index entry (e.g. version).
+
+        Returns:
+            dict: The index entry.
+        """
+        sha256 = file_sha256(jar_path)
+        object_path = self._object_path(sha256)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            _write_atomically(
+                object_path, lambda path: shutil.copyfile(jar_path, path)
+            )
+
+        entry = dict(
+            fields,
+            name=os.path.basename(jar_path),
+            sha256=sha256,
+            size=os.path.getsize(jar_path),
+            host=socket.gethostname(),
+            stored_at=int(time.time()),
+        )
+
+        def write_entry(path):
+            with open(file=path, mode="w", encoding="utf-8") as index_file:
+                json.dump(entry, index_file, indent=4)
+
+        _write_atomically(self._index_path(key), write_entry)
+
+        return entry
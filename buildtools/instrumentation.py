@@ -0,0 +1,86 @@
+"""Runs a build process while measuring its wall time, CPU time and peak memory."""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from processes import process_tree_memory_mb
+
+# Seconds between two measurements of the memory of the process tree
+SAMPLE_INTERVAL_SECONDS = 1.0
+
+
+def max_rss_mb(usage) -> float:
+    """
+    Converts the maximum resident memory of a resource usage to MB.
+
+    Args:
+        usage (resource.struct_rusage): The resource usage of a process.
+
+    Returns:
+        float: The memory in MB, macOS reports bytes while linux reports KB.
+    """
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return usage.ru_maxrss / divisor
+
+
+def run_instrumented(command: list, cwd: str, env: dict, log_path: str) -> dict:
+    """
+    Runs a command with its output streamed to a log file and measures it.
+
+    Args:
+        command (list): The command and its arguments.
+        cwd (str): The working directory of the command.
+        env (dict): The environment of the command.
+        log_path (str): The file stdout and stderr are written to while the command runs.
+
+    Returns:
+        dict: Exit code (None if it couldn't be started), wall time and CPU time
+              (user and system of the process and its children) in seconds and
+              the peak resident memory of the process tree in MB.
+    """
+    start = time.perf_counter()
+    with open(file=log_path, mode="w", encoding="utf-8") as log_file:
+        try:
+            process = subprocess.Popen(  # pylint: disable=R1732
+                command,
+                cwd=cwd,
+                env=env,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            log_file.write(f"Error starting {command[0]}: {e}\n")
+            return {
+                "exit_code": None,
+                "seconds": time.perf_counter() - start,
+                "cpu_seconds": 0.0,
+                "peak_rss_mb": 0.0,
+            }
+
+        # The JVM starts git and maven as children, so the whole tree is sampled
+        peak_rss = [0.0]
+        finished = threading.Event()
+
+        def sample():
+            while not finished.wait(SAMPLE_INTERVAL_SECONDS):
+                peak_rss[0] = max(peak_rss[0], process_tree_memory_mb(process.pid))
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+
+        # wait4 returns the resource usage of the process including its waited for children
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        finished.set()
+        sampler.join()
+
+    return {
+        "exit_code": process.returncode,
+        "seconds": time.perf_counter() - start,
+        "cpu_seconds": usage.ru_utime + usage.ru_stime,
+        # A peak between two samples is still seen by the biggest single process
+        "peak_rss_mb": max(peak_rss[0], max_rss_mb(usage)),
+    }
@@ -0,0 +1,142 @@
+"""Discovery of the installed JDKs, every runtime is probed once for its exact version."""
+
+import glob
+import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# Directories containing one JDK per subdirectory (linux packages, SDKMAN and macOS)
+JDK_SEARCH_DIRS = [
+    "/usr/lib/jvm",
+    "~/.sdkman/candidates/java",
+    "/Library/Java/JavaVirtualMachines",
+]
+# Location of the java executable below a JDK directory
+JAVA_EXECUTABLES = ["bin/java", "Contents/Home/bin/java"]
+# Seconds a runtime may take to print its properties
+PROBE_TIMEOUT_SECONDS = 30
+
+
+def candidate_java_paths(extra_java_paths: list = None) -> list:
+    """
+    Lists the java executables of all JDKs in the search directories and JAVA_HOME.
+
+    Args:
+        extra_java_paths (list, optional): Further java executables to consider.
+
+    Returns:
+        list: The real paths of the executables, without duplicates reached through symlinks.
+    """
+    homes = []
+    for search_dir in JDK_SEARCH_DIRS:
+        homes.extend(
+            sorted(glob.glob(os.path.join(os.path.expanduser(search_dir), "*")))
+        )
+    if os.environ.get("JAVA_HOME"):
+        homes.append(os.environ["JAVA_HOME"])
+
+    paths = [
+        os.path.join(home, executable)
+        for home in homes
+        for executable in JAVA_EXECUTABLES
+    ] + list(extra_java_paths or [])
+
+    return list(
+        dict.fromkeys(
+            os.path.realpath(path)
+            for path in paths
+            if os.path.isfile(path) and os.access(path, os.X_OK)
+        )
+    )
+
+
+def probe_jdk(java_path: str) -> dict:
+    """
+    Asks a java runtime for its version.
+
+    Args:
+        java_path (str): The path of the java executable.
+
+    Returns:
+        dict: Path, major version (e.g. 17) and full version (e.g. 17.0.9) of the runtime,
+              None if it can't be run.
+    """
+    try:
+        output = subprocess.run(
+            [java_path, "-XshowSettings:properties", "-version"],
+            capture_output=True,
+            text=True,
+            timeout=PROBE_TIMEOUT_SECONDS,
+            check=False,
+        ).stderr
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"Error probing {java_path}: {e}")
+        return None
+
+    specification = re.search(r"java\.specification\.version = (\S+)", output)
+    version = re.search(r"java\.version = (\S+)", output)
+    if not specification or not version:
+        print(f"Error probing {java_path}: no version found")
+        return None
+
+    # Java 8 and older report their specification version as 1.x
+    major = specification.group(1).removeprefix("1.")
+    return {"path": java_path, "major": int(major), "version": version.group(1)}
+
+
+def version_key(version: str) -> tuple:
+    """
+    Sort key of a java or minecraft version.
+
+    Args:
+        version (str): The version (e.g. 17.0.9 or 1.8.0_392).
+
+    Returns:
+        tuple: The numeric parts of the version.
+    """
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
+
+def discover_jdks(extra_java_paths: list = None) -> list:
+    """
+    Finds and probes all installed JDKs.
+
+    Args:
+        extra_java_paths (list, optional): Further java executables to consider.
+
+    Returns:
+        list: The runtimes which could be probed, newest first.
+    """
+    paths = candidate_java_paths(extra_java_paths)
+    with ThreadPoolExecutor(max_workers=max(1, len(paths))) as executor:
+        jdks = [jdk for jdk in executor.map(probe_jdk, paths) if jdk]
+
+    return sorted(
+        jdks,
+        key=lambda jdk: (jdk["major"], version_key(jdk["version"])),
+        reverse=True,
+    )
+
+
+def match_jdk(jdks: list, min_major: int, max_major: int = None) -> dict:
+    """
+    Picks the newest runtime within the supported java versions.
+
+    Args:
+        jdks (list): The discovered runtimes, newest first.
+        min_major (int): The oldest supported java version.
+        max_major (int, optional): The newest supported java version, unlimited if not given.
+
+    Returns:
+        dict: The runtime or None if no compatible one is installed.
+    """
+    return next(
+        (
+            jdk
+            for jdk in jdks
+            if jdk["major"] >= min_major
+            and (max_major is None or jdk["major"] <= max_major)
+        ),
+        None,
+    )
@@ -0,0 +1,224 @@
+"""Build matrix derived from the mojang version metadata and the versions BuildTools knows."""
+
+# pylint: disable=C0301
+
+import json
+import os
+import re
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from .jdks import version_key
+
+MOJANG_MANIFEST_URL = "https://piston-meta.mojang.com/mc/game/version_manifest_v2.json"
+# Directory listing of the versions BuildTools can build, one <version>.json per version
+SPIGOT_VERSIONS_URL = "https://hub.spigotmc.org/versions/"
+# Java versions of every already resolved minecraft version, keyed by the sha1 of its metadata document
+MATRIX_CACHE_FILENAME = "buildtools_matrix_cache.json"
+# Oldest minecraft version BuildTools can build
+MIN_VERSION = "1.8"
+# Class file versions BuildTools accepts for the versions whose <version>.json has no javaVersions (java 7 to 8)
+DEFAULT_JAVA_VERSIONS = [51, 52]
+# Difference between the class file version and the major version of a java release (52 is java 8)
+CLASS_FILE_VERSION_OFFSET = 44
+# Maximum amount of metadata documents fetched at the same time
+MAX_PARALLEL_REQUESTS = 8
+# Seconds a request may take
+REQUEST_TIMEOUT_SECONDS = 60
+
+
+def fetch(url: str) -> bytes:
+    """
+    Fetches a document.
+
+    Args:
+        url (str): The URL of the document.
+
+    Returns:
+        bytes: The body or None if the request failed.
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=REQUEST_TIMEOUT_SECONDS) as response:
+            return response.read()
+    except (OSError, ValueError) as e:
+        print(f"Error fetching {url}: {e}")
+        return None
+
+
+def fetch_json(url: str):
+    """
+    Fetches a JSON document.
+
+    Args:
+        url (str): The URL of the document.
+
+    Returns:
+        The parsed document or None if it can't be fetched or parsed.
+    """
+    body = fetch(url)
+    if body is None:
+        return None
+
+    try:
+        return json.loads(body)
+    except ValueError as e:
+        print(f"Error parsing {url}: {e}")
+        return None
+
+
+def load_matrix_cache(filename: str) -> dict:
+    """
+    Loads the java versions resolved by previous runs.
+
+    Args:
+        filename (str): The name of the cache file.
+
+    Returns:
+        dict: Minecraft versions mapped to the sha1 of their metadata and their java versions.
+    """
+    if not os.path.exists(filename):
+        return {}
+
+    with open(file=filename, mode="r", encoding="utf-8") as cache_file:
+        try:
+            return json.load(cache_file)
+        except json.JSONDecodeError:
+            print(f"Ignoring the unreadable {filename}, every release is resolved again.")
+            return {}
+
+
+def java_versions(document: dict) -> list:
+    """
+    Returns the java versions BuildTools accepts for a minecraft version.
+
+    Args:
+        document (dict): The <version>.json of the minecraft version from SPIGOT_VERSIONS_URL.
+
+    Returns:
+        list: The oldest and newest accepted java version.
+    """
+    class_file_versions = document.get("javaVersions") or DEFAULT_JAVA_VERSIONS
+
+    return [
+        class_file_version - CLASS_FILE_VERSION_OFFSET
+        for class_file_version in class_file_versions
+    ]
+
+
+def fetch_spigot_versions() -> set:
+    """
+    Fetches the minecraft versions BuildTools can build.
+
+    Returns:
+        set: The versions or None if the listing can't be fetched.
+    """
+    body = fetch(SPIGOT_VERSIONS_URL)
+    if body is None:
+        return None
+
+    return set(
+        re.findall(
+            r'href="(\d+\.\d+(?:\.\d+)?)\.json"', body.decode("utf-8", errors="replace")
+        )
+    )
+
+
+def build_matrix(cache_filename: str = MATRIX_CACHE_FILENAME) -> list:
+    """
+    Lists every release BuildTools can build with the java versions it supports.
+
+    The oldest java version is the newer one of the version Mojang requires and the oldest one BuildTools
+    accepts, the newest is the newest one BuildTools accepts. Only metadata documents which are new or
+    changed since the last run are fetched, together with the BuildTools <version>.json of these releases.
+
+    Args:
+        cache_filename (str): The file the resolved java versions are cached in.
+
+    Returns:
+        list: Version, oldest (min_java) and newest (max_java) supported java version of every release, oldest release first.
+    """
+    manifest = fetch_json(MOJANG_MANIFEST_URL)
+    if manifest is None:
+        raise RuntimeError("The version manifest is not available, no build matrix")
+
+    releases = [
+        version
+        for version in manifest.get("versions", [])
+        if version.get("type") == "release"
+        and version_key(version["id"]) >= version_key(MIN_VERSION)
+    ]
+    spigot_versions = fetch_spigot_versions()
+    if spigot_versions is None:
+        print("Building every release as the BuildTools versions are unknown.")
+    else:
+        releases = [
+            version for version in releases if version["id"] in spigot_versions
+        ]
+
+    cache = load_matrix_cache(cache_filename)
+    outdated = [
+        version
+        for version in releases
+        if cache.get(version["id"], {}).get("sha1") != version.get("sha1")
+    ]
+    print(
+        f"Fetching the metadata of {len(outdated)} of {len(releases)} releases, the others are cached."
+    )
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        documents = list(
+            executor.map(lambda version: fetch_json(version["url"]), outdated)
+        )
+    for version, document in zip(outdated, documents):
+        if document is None:
+            continue
+        cache[version["id"]] = {
+            "sha1": version.get("sha1"),
+            # Mojang lists java 8 for all versions from before the field was introduced
+            "java_major": document.get("javaVersion", {}).get("majorVersion", 8),
+        }
+
+    unresolved = [
+        version["id"]
+        for version in releases
+        if version["id"] in cache and "java_versions" not in cache[version["id"]]
+    ]
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        documents = list(
+            executor.map(
+                lambda version: fetch_json(
+                    urljoin(SPIGOT_VERSIONS_URL, f"{version}.json")
+                ),
+                unresolved,
+            )
+        )
+    for version, document in zip(unresolved, documents):
+        if document is not None:
+            cache[version]["java_versions"] = java_versions(document)
+
+    # Only keep the releases which are still listed
+    cache = {
+        version["id"]: cache[version["id"]]
+        for version in releases
+        if version["id"] in cache
+    }
+    with open(file=cache_filename, mode="w", encoding="utf-8") as json_file:
+        json.dump(cache, json_file, indent=4)
+
+    matrix = []
+    for version in sorted(releases, key=lambda version: version_key(version["id"])):
+        if "java_versions" not in cache.get(version["id"], {}):
+            print(
+                f"Skipping minecraft version {version['id']} as its metadata is not available."
+            )
+            continue
+        min_java, max_java = cache[version["id"]]["java_versions"]
+        matrix.append(
+            {
+                "version": version["id"],
+                "min_java": max(cache[version["id"]]["java_major"], min_java),
+                "max_java": max_java,
+            }
+        )
+
+    return matrix
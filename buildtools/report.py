@@ -0,0 +1,184 @@
+"""Machine-readable reports of the build runs, every run is compared against the previous ones."""
+
+# pylint: disable=C0301
+
+import glob
+import json
+import os
+import socket
+import statistics
+import time
+
+# Directory the report of every run is written to
+REPORT_DIR = "buildtools_reports"
+# Amount of previous runs a build is compared against, using the median of each metric
+HISTORY_RUNS = 5
+# Relative change of a metric above which it is reported as a regression
+REGRESSION_THRESHOLD = 0.25
+# Metrics of a build which are compared (higher is worse for all of them) with the smallest
+# absolute change reported as a regression, so short builds don't report their jitter
+METRICS = {
+    "seconds": 30,
+    "cpu_seconds": 30,
+    "peak_rss_mb": 128,
+    "jar_bytes": 1024 * 1024,
+}
+# Statuses of a build whose jars are in the output directory
+SUCCESSFUL_STATUSES = ("ok", "cached")
+
+
+def build_id(result: dict) -> str:
+    """
+    Returns the identifier of a build which stays the same between runs.
+
+    Args:
+        result (dict): The finished build.
+
+    Returns:
+        str: The identifier (e.g. spigot 1.21.4).
+    """
+    return f"{result['compile_type']} {result['version']}"
+
+
+def load_previous_reports(report_dir: str = REPORT_DIR, runs: int = HISTORY_RUNS) -> list:
+    """
+    Loads the reports of the latest runs.
+
+    Args:
+        report_dir (str): The directory of the reports.
+        runs (int): The maximum amount of reports to load.
+
+    Returns:
+        list: The reports, newest first.
+    """
+    reports = []
+    for path in sorted(glob.glob(os.path.join(report_dir, "run-*.json")), reverse=True):
+        try:
+            with open(file=path, mode="r", encoding="utf-8") as report_file:
+                reports.append(json.load(report_file))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if len(reports) == runs:
+            break
+
+    return reports
+
+
+def compare_build(result: dict, previous_results: list) -> dict:
+    """
+    Compares a build with the same build in previous runs.
+
+    Args:
+        result (dict): The finished build.
+        previous_results (list): The same build in previous runs, newest first.
+
+    Returns:
+        dict: Previous status, baseline (median) of every metric over the successful previous
+              runs, relative change against it and the metrics which regressed.
+    """
+    comparison = {
+        "previous_status": previous_results[0]["status"] if previous_results else None,
+        "baseline": {},
+        "change": {},
+        "regressions": [],
+    }
+    successful = [previous for previous in previous_results if previous["status"] == "ok"]
+    if result["status"] != "ok" or not successful:
+        return comparison
+
+    for metric, min_change in METRICS.items():
+        values = [previous[metric] for previous in successful if previous.get(metric)]
+        if not values or result.get(metric) is None:
+            continue
+        baseline = statistics.median(values)
+        change = (result[metric] - baseline) / baseline
+        comparison["baseline"][metric] = baseline
+        comparison["change"][metric] = round(change, 3)
+        if change > REGRESSION_THRESHOLD and result[metric] - baseline >= min_change:
+            comparison["regressions"].append(metric)
+
+    return comparison
+
+
+def write_run_report(results: list, started_at: float, report_dir: str = REPORT_DIR) -> dict:
+    """
+    Writes the report of a run, comparing every build with the previous runs.
+
+    Args:
+        results (list): The finished builds.
+        started_at (float): Unix time the run started at.
+        report_dir (str): The directory of the reports.
+
+    Returns:
+        dict: The report.
+    """
+    previous_reports = load_previous_reports(report_dir)
+    history = {}
+    for previous_report in previous_reports:
+        for previous in previous_report["builds"]:
+            history.setdefault(build_id(previous), []).append(previous)
+
+    builds = [
+        dict(result, comparison=compare_build(result, history.get(build_id(result), [])))
+        for result in results
+    ]
+    built = [build for build in builds if build["status"] in ("ok", "failed")]
+    report = {
+        "started_at": int(started_at),
+        "host": socket.gethostname(),
+        "compared_runs": len(previous_reports),
+        "totals": {
+            "builds": len(builds),
+            "statuses": {
+                status: sum(1 for build in builds if build["status"] == status)
+                for status in sorted({build["status"] for build in builds})
+            },
+            "seconds": time.time() - started_at,
+            "cpu_seconds": sum(build["cpu_seconds"] for build in built),
+            "peak_rss_mb": max((build["peak_rss_mb"] for build in built), default=0.0),
+        },
+        "builds": builds,
+    }
+
+    os.makedirs(report_dir, exist_ok=True)
+    path = os.path.join(
+        report_dir, f"run-{time.strftime('%Y%m%d-%H%M%S', time.localtime(started_at))}.json"
+    )
+    with open(file=path, mode="w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=4)
+    print(f"Run report saved to {path}, compared with {len(previous_reports)} previous runs.")
+
+    return report
+
+
+def print_comparison(report: dict):
+    """
+    Prints the builds which regressed or changed their status since the previous run.
+
+    Args:
+        report (dict): The report of the run.
+    """
+    changes = []
+    for build in report["builds"]:
+        comparison = build["comparison"]
+        previous_status = comparison["previous_status"]
+        # Taking the jars from the cache instead of building them isn't a change worth reporting
+        if previous_status and (previous_status in SUCCESSFUL_STATUSES) != (
+            build["status"] in SUCCESSFUL_STATUSES
+        ):
+            changes.append(
+                f"- {build_id(build)}: {previous_status} before, {build['status']} now"
+            )
+        for metric in comparison["regressions"]:
+            changes.append(
+                f"- {build_id(build)}: {metric} {build[metric]:.1f} is {comparison['change'][metric]:+.0%} against {comparison['baseline'][metric]:.1f}"
+            )
+
+    if not report["compared_runs"]:
+        return
+    if not changes:
+        print(f"No regressions against the previous {report['compared_runs']} runs.")
+        return
+    print(f"Changes against the previous {report['compared_runs']} runs:")
+    for change in changes:
+        print(change)
@@ -0,0 +1,18 @@
+"""Crawlers of the minecraft server jar download links, run them with python -m crawlers."""
+
+# pylint: disable=C0301
+
+from .base import Crawler, save_to_json
+from .http_client import HttpClient
+
+__all__ = ["Crawler", "HttpClient", "save_to_json"]
+
+
+def __getattr__(name: str):
+    # The registry imports every crawler and creates their clients, so it is only loaded when asked for
+    if name == "CRAWLERS":
+        from .registry import CRAWLERS  # pylint: disable=C0415
+
+        return CRAWLERS
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
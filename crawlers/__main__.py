@@ -0,0 +1,90 @@
+"""Runs several crawlers in one process, sharing their connections, rate limits and cache."""
+
+# pylint: disable=C0301
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .registry import CRAWLERS
+
+
+def parse_arguments(arguments: list) -> argparse.Namespace:
+    """
+    Parses the command line.
+
+    Args:
+        arguments (list): The arguments without the program name.
+
+    Returns:
+        argparse.Namespace: The selected sources and options.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m crawlers",
+        description="Collects the direct download links of minecraft server jars.",
+    )
+    parser.add_argument(
+        "sources",
+        nargs="*",
+        help=f"Sources to crawl ({', '.join(CRAWLERS)}), all of them if none are given.",
+        metavar="source",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List the available sources and exit."
+    )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run the crawlers one after another instead of at the same time.",
+    )
+
+    options = parser.parse_args(arguments)
+
+    unknown = [source for source in options.sources if source not in CRAWLERS]
+    if unknown:
+        parser.error(f"unknown sources: {', '.join(unknown)}")
+
+    return options
+
+
+def main(arguments: list = None) -> int:
+    """
+    Runs the selected crawlers and prints a summary.
+
+    Args:
+        arguments (list, optional): The arguments, taken from the command line if not given.
+
+    Returns:
+        int: Exit code, 1 if any crawler failed.
+    """
+    options = parse_arguments(sys.argv[1:] if arguments is None else arguments)
+
+    if options.list:
+        for name, crawler in CRAWLERS.items():
+            print(f"{name}: {crawler.__doc__}")
+        return 0
+
+    # dict.fromkeys drops sources which were given twice but keeps the order
+    names = list(dict.fromkeys(options.sources)) or list(CRAWLERS)
+    crawlers = [CRAWLERS[name]() for name in names]
+    start = time.perf_counter()
+
+    if options.sequential:
+        results = [crawler.run() for crawler in crawlers]
+    else:
+        with ThreadPoolExecutor(max_workers=len(crawlers)) as executor:
+            results = list(executor.map(lambda crawler: crawler.run(), crawlers))
+
+    print("Summary:")
+    for result in results:
+        status = f"failed ({result['error']})" if result["error"] else "ok"
+        print(
+            f"- {result['name']}: {status}, {result['requests']} requests ({result['failed_requests']} failed) in {result['seconds']:.2f}s"
+        )
+    print(f"Crawled {len(results)} sources in {time.perf_counter() - start:.2f}s")
+
+    return 1 if any(result["error"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
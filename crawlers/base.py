@@ -0,0 +1,192 @@
+"""Pieces shared by every crawler of the package."""
+
+# pylint: disable=C0301,W0718
+
+import json
+import os
+import re
+import time
+import traceback
+
+
+def save_to_json(data, filename: str):
+    """
+    Saves given data to a JSON file.
+
+    Args:
+        data (_type_): The data to write to the file.
+        filename (str): The name of the output file.
+    """
+    with open(file=filename, mode="w", encoding="utf-8") as json_file:
+        json.dump(data, json_file, indent=4)
+
+    print(f"Download links saved to {filename}")
+
+
+def load_json(filename: str) -> dict:
+    """
+    Loads a JSON file written by an earlier run.
+
+    Args:
+        filename (str): The name of the file.
+
+    Returns:
+        dict: The content, empty if the file doesn't exist yet or can't be parsed.
+    """
+    try:
+        with open(file=filename, mode="r", encoding="utf-8") as json_file:
+            return json.load(json_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def version_key(version: str) -> tuple:
+    """
+    Sort key of a minecraft, forge or java version.
+
+    Args:
+        version (str): The version (e.g. 1.20.1, 47.2.0 or 1.8.0_392).
+
+    Returns:
+        tuple: The numeric parts of the version.
+    """
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
+
+def fetch_response(client, url: str, timeout: int = 120):
+    """
+    Sends a GET request and checks that it succeeded.
+
+    Args:
+        client (HttpClient): The client to send the request with.
+        url (str): The URL to request.
+        timeout (int): Timeout of the request in seconds.
+
+    Returns:
+        requests.Response: The response or None if the request failed or its status isn't 200.
+    """
+    try:
+        response = client.get(url=url, timeout=timeout)
+    except Exception as e:
+        print(f"Error fetching {url}: {e}")
+        return None
+
+    if response.status_code != 200:
+        print(f"Error fetching {url}: {response.status_code}")
+        return None
+
+    return response
+
+
+def fetch_json(client, url: str, timeout: int = 120):
+    """
+    Fetches a JSON document.
+
+    Args:
+        client (HttpClient): The client to send the request with.
+        url (str): The URL of the document.
+        timeout (int): Timeout of the request in seconds.
+
+    Returns:
+        The parsed document or None if it can't be fetched or parsed.
+    """
+    response = fetch_response(client, url, timeout)
+    if response is None:
+        return None
+
+    try:
+        return response.json()
+    except ValueError as e:
+        print(f"Error parsing {url}: {e}")
+        return None
+
+
+def failed_filename(filename: str) -> str:
+    """
+    Returns the name of the file listing the keys an output file is missing.
+
+    Args:
+        filename (str): The name of the output file (e.g. paper_downloads.json).
+
+    Returns:
+        str: The name of the sidecar file (e.g. paper_downloads.failed.json).
+    """
+    return f"{filename.removesuffix('.json')}.failed.json"
+
+
+def save_failed_keys(failed_keys, filename: str):
+    """
+    Saves the keys which could not be crawled next to the output file, so they can be retried.
+    Removes the file of an earlier run if nothing failed.
+
+    Args:
+        failed_keys (list | dict): The failed keys, a dict may map them to the failed URL.
+        filename (str): The name of the output file the keys are missing from.
+    """
+    sidecar = failed_filename(filename)
+    if not failed_keys:
+        if os.path.exists(sidecar):
+            os.remove(sidecar)
+        return
+
+    with open(file=sidecar, mode="w", encoding="utf-8") as json_file:
+        json.dump(failed_keys, json_file, indent=4)
+
+    print(f"{len(failed_keys)} failed keys saved to {sidecar}")
+
+
+class Crawler:
+    """A source of server jar download links which can be run on its own or next to other crawlers."""
+
+    # Name of the source, used on the command line and in the summary
+    name = ""
+    # Clients of the crawler, their requests are counted in the summary
+    clients = ()
+
+    def crawl(self):
+        """Crawls the source and writes its output files."""
+        raise NotImplementedError
+
+    def request_count(self) -> int:
+        """
+        Returns the amount of requests the clients of the crawler sent so far.
+
+        Returns:
+            int: Sent requests, cache hits included.
+        """
+        return sum(client.request_count() for client in self.clients)
+
+    def failure_count(self) -> int:
+        """
+        Returns the amount of requests of the crawler which failed after all retries.
+
+        Returns:
+            int: Failed requests.
+        """
+        return sum(client.failure_count() for client in self.clients)
+
+    def run(self) -> dict:
+        """
+        Runs the crawler and keeps errors from reaching the other crawlers of the process.
+
+        Returns:
+            dict: Name, wall time in seconds, sent and failed requests and the error if the crawl failed.
+        """
+        start = time.perf_counter()
+        requests_before = self.request_count()
+        failures_before = self.failure_count()
+        error = None
+
+        try:
+            self.crawl()
+        except (Exception, SystemExit) as exception:
+            traceback.print_exc()
+            error = f"{type(exception).__name__}: {exception}"
+
+        return {
+            "name": self.name,
+            "seconds": time.perf_counter() - start,
+            "requests": self.request_count() - requests_before,
+            "failed_requests": self.failure_count() - failures_before,
+            "error": error,
+        }
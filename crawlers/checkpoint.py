@@ -0,0 +1,132 @@
+"""Append-only journal of finished items, so an interrupted crawl resumes where it stopped."""
+
+import functools
+import json
+import os
+import threading
+import time
+
+# Directory the journals are kept in, one JSON lines file per crawler
+CHECKPOINT_DIR = ".checkpoints"
+# Journals older than this are from an abandoned crawl and are started over
+CHECKPOINT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+class Checkpoint:
+    """Journal of the items a crawler finished, replayed when the crawler is started again."""
+
+    def __init__(
+        self,
+        name: str,
+        directory: str = CHECKPOINT_DIR,
+        max_age_seconds: int = CHECKPOINT_MAX_AGE_SECONDS,
+    ):
+        """
+        Opens the journal of a crawler and replays the items of an interrupted run.
+
+        Args:
+            name (str): Name of the crawler (or part of it), used as file name.
+            directory (str): Directory the journal is kept in.
+            max_age_seconds (int): Maximum age of a journal which is resumed.
+        """
+        self.path = os.path.join(directory, f"{name}.jsonl")
+        self._lock = threading.Lock()
+        self._file = None
+
+        os.makedirs(directory, exist_ok=True)
+        try:
+            if time.time() - os.path.getmtime(self.path) > max_age_seconds:
+                os.remove(self.path)
+        except OSError:
+            pass
+
+        self.items = self._replay()
+        if self.items:
+            print(f"Resuming from {self.path} with {len(self.items)} finished items.")
+
+    def _replay(self) -> dict:
+        items = {}
+        try:
+            with open(file=self.path, mode="r", encoding="utf-8") as journal:
+                for line in journal:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # The last line is cut off if the crawl was killed while writing it
+                        continue
+                    items[entry["key"]] = entry["value"]
+        except FileNotFoundError:
+            pass
+
+        return items
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.items
+
+    def get(self, key: str, default=None):
+        """
+        Returns the journaled value of an item.
+
+        Args:
+            key (str): The key of the item.
+            default (optional): Returned if the item isn't journaled.
+
+        Returns:
+            The value of the item.
+        """
+        return self.items.get(key, default)
+
+    def record(self, key: str, value):
+        """
+        Appends a finished item to the journal, flushed right away so it survives a crash.
+
+        Args:
+            key (str): The key of the item.
+            value: The JSON serializable value of the item.
+        """
+        line = json.dumps({"key": key, "value": value}) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(  # pylint: disable=R1732
+                    file=self.path, mode="a", encoding="utf-8"
+                )
+            self._file.write(line)
+            self._file.flush()
+            self.items[key] = value
+
+    def wrap(self, function, complete=bool):
+        """
+        Wraps a function processing one item, so journaled items are skipped and new ones journaled.
+
+        Args:
+            function (callable): The function, its last positional argument is the key of the item.
+            complete (callable): Tells from a result whether the item is finished,
+                                 unfinished items are processed again on the next run.
+
+        Returns:
+            callable: The wrapped function.
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args):
+            key = args[-1]
+            if key in self.items:
+                return self.items[key]
+
+            result = function(*args)
+            if complete(result):
+                self.record(key, result)
+            return result
+
+        return wrapper
+
+    def finish(self):
+        """Removes the journal once the crawler wrote its final output, the next run starts over."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
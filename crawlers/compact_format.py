@@ -0,0 +1,166 @@
+"""Compact output format storing one URL template plus a parameter table per version.
+
+Reference decoder for clients (the expanded files stay available as well):
+
+    def expand(compact):
+        urls = {}
+        for version, values in compact["versions"].items():
+            if values is None:
+                urls[version] = compact["urls"][version]
+                continue
+            params = dict(compact["constants"], **dict(zip(compact["fields"], values)))
+            urls[version] = compact["template"].format(version=version, **params)
+        return urls
+"""
+
+# pylint: disable=C0301
+
+import json
+import re
+import string
+import sys
+
+FORMAT_VERSION = 2
+
+
+def expand(compact: dict) -> dict:
+    """
+    Expands a compact document back into versions mapped to their URL.
+
+    Args:
+        compact (dict): The compact document.
+
+    Returns:
+        dict: Versions mapped to their URL, in the order of the expanded file.
+    """
+    urls = {}
+    for version, values in compact["versions"].items():
+        if values is None:
+            urls[version] = compact["urls"][version]
+            continue
+        params = dict(compact["constants"], **dict(zip(compact["fields"], values)))
+        urls[version] = compact["template"].format(version=version, **params)
+
+    return urls
+
+
+def template_pattern(template: str, version: str) -> re.Pattern:
+    """
+    Builds a regex matching URLs of the template for one version.
+
+    Args:
+        template (str): The URL template with {placeholders}.
+        version (str): The version filled into {version}.
+
+    Returns:
+        re.Pattern: Pattern capturing every other placeholder as named group.
+    """
+    pattern = ""
+    seen = set()
+    for literal, field, _, _ in string.Formatter().parse(template):
+        pattern += re.escape(literal)
+        if field is None:
+            continue
+        if field == "version":
+            pattern += re.escape(version)
+        elif field in seen:
+            pattern += f"(?P={field})"
+        else:
+            pattern += f"(?P<{field}>[^/]+?)"
+            seen.add(field)
+
+    return re.compile(f"{pattern}$")
+
+
+def compact_urls(urls: dict, template: str) -> dict:
+    """
+    Converts versions mapped to their URL into the compact format.
+
+    Parameters with the same value for every version are stored once as constant,
+    URLs not matching the template are kept as they are with a null placeholder in
+    versions, so the versions keep their order.
+
+    Args:
+        urls (dict): Versions mapped to their URL.
+        template (str): The URL template, {version} is filled with the version.
+
+    Returns:
+        dict: The compact document.
+    """
+    params_per_version = {}
+    unmatched = {}
+    for version, url in urls.items():
+        match = template_pattern(template, version).match(url)
+        if match:
+            params_per_version[version] = match.groupdict()
+        else:
+            unmatched[version] = url
+
+    field_names = []
+    for params in params_per_version.values():
+        field_names.extend(name for name in params if name not in field_names)
+
+    constants = {}
+    fields = []
+    for name in field_names:
+        values = {params.get(name) for params in params_per_version.values()}
+        if len(values) == 1:
+            constants[name] = values.pop()
+        else:
+            fields.append(name)
+
+    return {
+        "format": FORMAT_VERSION,
+        "template": template,
+        "constants": constants,
+        "fields": fields,
+        "versions": {
+            version: (
+                [params_per_version[version][name] for name in fields]
+                if version in params_per_version
+                else None
+            )
+            for version in urls
+        },
+        "urls": unmatched,
+    }
+
+
+def compact_filename(filename: str) -> str:
+    """
+    Returns the name of the compact file next to an expanded output file.
+
+    Args:
+        filename (str): The name of the expanded file (e.g. paper_downloads.json).
+
+    Returns:
+        str: The name of the compact file (e.g. paper_downloads.compact.json).
+    """
+    return re.sub(r"\.json$", "", filename) + ".compact.json"
+
+
+def save_compact(data: dict, filename: str):
+    """
+    Saves a compact document without any whitespace.
+
+    Args:
+        data (dict): The compact document or a dict of compact documents.
+        filename (str): The name of the expanded output file the document belongs to.
+    """
+    with open(file=compact_filename(filename), mode="w", encoding="utf-8") as json_file:
+        json.dump(data, json_file, separators=(",", ":"))
+
+    print(f"Compact download links saved to {compact_filename(filename)}")
+
+
+if __name__ == "__main__":
+    # Expands a compact file, e.g. python compact_format.py paper_downloads.compact.json
+    with open(file=sys.argv[1], mode="r", encoding="utf-8") as compact_file:
+        document = json.load(compact_file)
+
+    if "template" in document:
+        document = expand(document)
+    else:
+        document = {name: expand(section) for name, section in document.items()}
+
+    print(json.dumps(document, indent=4))
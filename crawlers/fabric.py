@@ -0,0 +1,252 @@
+"""Simple script to get all fabric server jar direct download links."""
+
+# pylint: disable=C0301
+
+from concurrent.futures import ThreadPoolExecutor
+from .base import Crawler, fetch_json, load_json, save_failed_keys, save_to_json
+from .compact_format import compact_urls, save_compact
+from .http_client import HttpClient
+
+FABRIC_META_URL = "https://meta.fabricmc.net/v2/versions"
+DOWNLOAD_URL_TEMPLATE = f"{FABRIC_META_URL}/loader/{{version}}/{{loader}}//{{installer}}/server/jar"
+# Set to True to use the newest loader compatible with each game version instead of the latest loader
+PER_GAME_LOADER = False
+# Loader versions resolved per game version by previous runs
+LOADER_CACHE_FILENAME = "fabric_loader_cache.json"
+# Maximum amount of requests running at the same time
+MAX_PARALLEL_REQUESTS = 8
+
+client = HttpClient("fabric")
+
+
+def fetch_all_data(urls: list) -> list:
+    """
+    Fetches JSON data from all given URLs concurrently.
+
+    Args:
+        urls (list): The URLs to fetch data from.
+
+    Returns:
+        list: The JSON data of every URL (None if it failed), in the same order as the URLs.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        return list(executor.map(lambda url: fetch_json(client, url), urls))
+
+
+def load_loader_cache(filename: str) -> dict:
+    """
+    Loads the loader versions resolved per game version by previous runs.
+
+    Args:
+        filename (str): The name of the cache file.
+
+    Returns:
+        dict: The latest loader version of the previous run and the loader per game version.
+    """
+    cache = load_json(filename)
+    cache.setdefault("latest_loader", None)
+    cache.setdefault("loaders", {})
+    return cache
+
+
+def fetch_compatible_loader(game_version: str) -> tuple[str, bool]:
+    """
+    Fetches the newest loader compatible with a game version.
+
+    Args:
+        game_version (str): The game version.
+
+    Returns:
+        tuple[str, bool]: The loader version or None if no loader supports the game version
+                          and whether the loaders couldn't be fetched.
+    """
+    loaders = fetch_json(client, f"{FABRIC_META_URL}/loader/{game_version}")
+    if loaders is None:
+        return None, True
+
+    if not loaders:
+        return None, False
+
+    return loaders[0]["loader"]["version"], False
+
+
+def resolve_compatible_loaders(
+    game_versions: list, latest_loader_version: str
+) -> tuple[dict, list]:
+    """
+    Resolves the newest compatible loader of every game version.
+
+    The cached loaders are reused as long as no new loader was released since the
+    previous run, only new game versions are queried then.
+
+    Args:
+        game_versions (list): List of game version strings.
+        latest_loader_version (str): The latest loader version.
+
+    Returns:
+        tuple[dict, list]: Game versions mapped to their loader version (None if there is none) and the
+                           game versions whose loaders couldn't be fetched, those keep the loader of the previous run.
+    """
+    cache = load_loader_cache(LOADER_CACHE_FILENAME)
+    previous_loaders = cache["loaders"]
+    if cache["latest_loader"] != latest_loader_version:
+        cache = {"latest_loader": latest_loader_version, "loaders": {}}
+
+    missing_versions = [
+        version for version in game_versions if version not in cache["loaders"]
+    ]
+    print(
+        f"Querying compatible loaders of {len(missing_versions)} of {len(game_versions)} game versions."
+    )
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        results = list(executor.map(fetch_compatible_loader, missing_versions))
+
+    # Failed game versions aren't cached, so they are queried again by the next run
+    failed_versions = []
+    for version, (loader, failed) in zip(missing_versions, results):
+        if failed:
+            failed_versions.append(version)
+        else:
+            cache["loaders"][version] = loader
+
+    cache["loaders"] = {
+        version: cache["loaders"][version]
+        for version in game_versions
+        if version in cache["loaders"]
+    }
+    save_to_json(cache, LOADER_CACHE_FILENAME)
+
+    loaders = {
+        version: cache["loaders"].get(version, previous_loaders.get(version))
+        for version in game_versions
+    }
+    return loaders, failed_versions
+
+
+def filter_versions(game_versions: list, stable: bool) -> list:
+    """
+    Filters game versions based on their stability.
+
+    Args:
+        game_versions (list): List of game version data.
+        stable (bool): True for stable versions, False for non-stable versions.
+
+    Returns:
+        list: List of filtered game version strings.
+    """
+    return [
+        version["version"] for version in game_versions if version["stable"] == stable
+    ]
+
+
+def construct_download_urls(
+    versions: list,
+    loader_version: str,
+    installer_version: str,
+    loader_versions: dict = None,
+) -> dict:
+    """
+    Constructs a dictionary of download URLs for given game versions.
+
+    Args:
+        versions (list): List of game version strings.
+        loader_version (str): The loader version.
+        installer_version (str): The installer version.
+        loader_versions (dict, optional): Loader version per game version used instead
+            of loader_version, game versions without a loader are skipped.
+
+    Returns:
+        dict: A dictionary with game versions as keys and download URLs as values.
+    """
+    download_urls = {}
+
+    for version in versions:
+        version_loader = loader_version
+        if loader_versions is not None:
+            version_loader = loader_versions.get(version)
+            if not version_loader:
+                continue
+
+        download_url = DOWNLOAD_URL_TEMPLATE.format(
+            version=version, loader=version_loader, installer=installer_version
+        )
+        download_urls[version] = download_url
+
+    return download_urls
+
+
+def main():
+    """Main which executes everything."""
+    game_versions, loader_versions, installer_versions = fetch_all_data(
+        [
+            f"{FABRIC_META_URL}/game",
+            f"{FABRIC_META_URL}/loader",
+            f"{FABRIC_META_URL}/installer",
+        ]
+    )
+    if game_versions is None or not loader_versions or not installer_versions:
+        raise RuntimeError("The fabric versions are not available, nothing was crawled")
+
+    latest_loader_version = loader_versions[0]["version"]
+    latest_installer_version = installer_versions[0]["version"]
+
+    stable_versions = filter_versions(game_versions, stable=True)
+    non_stable_versions = filter_versions(game_versions, stable=False)
+
+    compatible_loaders = None
+    failed_versions = []
+    if PER_GAME_LOADER:
+        compatible_loaders, failed_versions = resolve_compatible_loaders(
+            stable_versions + non_stable_versions, latest_loader_version
+        )
+
+    stable_downloads = construct_download_urls(
+        stable_versions,
+        latest_loader_version,
+        latest_installer_version,
+        compatible_loaders,
+    )
+
+    non_stable_downloads = construct_download_urls(
+        non_stable_versions,
+        latest_loader_version,
+        latest_installer_version,
+        compatible_loaders,
+    )
+
+    save_to_json(stable_downloads, "release_fabric_downloads.json")
+    save_to_json(non_stable_downloads, "snapshot_fabric_downloads.json")
+    save_failed_keys(
+        [version for version in stable_versions if version in failed_versions],
+        "release_fabric_downloads.json",
+    )
+    save_failed_keys(
+        [version for version in non_stable_versions if version in failed_versions],
+        "snapshot_fabric_downloads.json",
+    )
+    save_compact(
+        compact_urls(stable_downloads, DOWNLOAD_URL_TEMPLATE),
+        "release_fabric_downloads.json",
+    )
+    save_compact(
+        compact_urls(non_stable_downloads, DOWNLOAD_URL_TEMPLATE),
+        "snapshot_fabric_downloads.json",
+    )
+    client.print_stats()
+
+    print("done")
+
+
+class FabricCrawler(Crawler):
+    """Fabric server launchers for every game version."""
+
+    name = "fabric"
+    clients = (client,)
+
+    def crawl(self):
+        main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+"""Simple script to get all forge server jar direct download links."""
+
+# pylint: disable=C0301,W0718
+
+import re
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from .base import (
+    Crawler,
+    fetch_response,
+    load_json,
+    save_failed_keys,
+    save_to_json,
+    version_key,
+)
+from .checkpoint import Checkpoint
+from .html_tree import parse_html
+from .http_client import HttpClient
+from .webdriver_pool import (
+    WebDriverPool,
+    apply_lean_profile,
+    load_page,
+    print_page_load_stats,
+)
+
+try:
+    from webdriver_manager.firefox import GeckoDriverManager
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+except ImportError:
+    webdriver = None
+
+FORGE_INDEX_URL = "https://files.minecraftforge.net/net/minecraftforge/forge/"
+ADFOCUS_PREFIX = "https://adfoc.us/serve/sitelinks/?id=271228&url="
+TITLE_PREFIX = "Downloads for Minecraft Forge - MC "
+DOWNLOAD_TITLES = ["Installer", "Universal", "Server"]
+MAVEN_URL = "https://maven.minecraftforge.net/net/minecraftforge/forge/"
+MAVEN_METADATA_URL = f"{MAVEN_URL}maven-metadata.xml"
+INSTALLER_URL_TEMP = "{maven_url}{build}/forge-{build}-installer.jar"
+# Oldest build shipping an installer jar, older builds only have universal and server zips and are left out
+FIRST_INSTALLER_BUILD = "1.5.2-7.8.0.684"
+OUTPUT_FILENAME = "forge_downloads.json"
+
+# "http" reads the static page markup, "selenium" renders every page in headless Firefox,
+# "maven" takes the latest build of every version from the maven metadata without visiting any page
+ENGINE = "http"
+# Set to False to skip writing the index of all builds from the maven metadata
+WRITE_BUILD_INDEX = True
+BUILD_INDEX_FILENAME = "forge_builds_index.json"
+# Set to True to retry the pages the http engine can't read with selenium
+SELENIUM_FALLBACK = False
+# Maximum amount of pages requested at the same time by the http engine
+MAX_PARALLEL_REQUESTS = 8
+# Amount of headless browsers rendering pages at the same time with selenium
+WEBDRIVER_WORKERS = 4
+# Set to False to not journal the processed pages, an interrupted crawl then starts over
+RESUMABLE_CRAWL = True
+
+client = HttpClient("forge")
+
+
+def initialize_driver():
+    """
+    Initialize the WebDriver with options.
+
+    Returns:
+        webdriver.Firefox: The initialized WebDriver.
+    """
+    if webdriver is None:
+        print("Selenium and webdriver-manager need to be installed to use the browser.")
+        sys.exit(1)
+
+    try:
+        options = webdriver.FirefoxOptions()
+        options.add_argument("--headless")
+
+        options.add_argument("--no-sandbox")
+        apply_lean_profile(options)
+        driver = webdriver.Firefox(
+            service=FirefoxService(GeckoDriverManager().install()), options=options
+        )
+        return driver
+    except Exception as e:
+        print(f"Error initializing the WebDriver: {e}")
+        sys.exit(1)
+
+
+def fetch_page(url: str):
+    """
+    Fetches the markup of a page and parses it.
+
+    Args:
+        url (str): The URL of the page.
+
+    Returns:
+        Node: The parsed page or None if it can't be fetched.
+    """
+    response = fetch_response(client, url, 60)
+    if response is None:
+        return None
+
+    return parse_html(response.text)
+
+
+def fetch_hrefs_http():
+    """
+    Fetches all href links from the main page markup and strips from adfocus link.
+
+    Returns:
+        list: A list of cleaned href URLs.
+    """
+    page = fetch_page(FORGE_INDEX_URL)
+    if page is None:
+        return []
+
+    li_version_list_elements = [
+        li for li in page.iter("li") if li.has_class("li-version-list")
+    ]
+    print(f"Found {len(li_version_list_elements)} 'li-version-list' elements.")
+
+    hrefs = []
+    for element in li_version_list_elements:
+        ul_element = element.find("ul", lambda ul: ul.has_class("nav-collapsible"))
+        if ul_element is None:
+            continue
+
+        for li in ul_element.iter("li"):
+            if "class" in li.attrs:
+                continue
+            a_tag = li.find("a")
+            if a_tag is None or not a_tag.attrs.get("href"):
+                continue
+            href = urljoin(FORGE_INDEX_URL, a_tag.attrs["href"])
+            href = href.replace(ADFOCUS_PREFIX, "")
+            hrefs.append(href)
+
+    return hrefs
+
+
+def process_link_http(link):
+    """
+    Processes the markup of a link, retrieves the title, and finds the appropriate download link.
+
+    Args:
+        link (str): The URL to process.
+
+    Returns:
+        str: The stripped title.
+        str: The found href URL.
+    """
+    page = fetch_page(link)
+    if page is None:
+        return None, None
+
+    title_element = page.find("h1", lambda h1: h1.text().startswith(TITLE_PREFIX))
+    if title_element is None:
+        print(f"Error processing link {link}: no title found")
+        return None, None
+
+    stripped_title = title_element.text().replace(TITLE_PREFIX, "").strip()
+
+    href_found = None
+    for title in DOWNLOAD_TITLES:
+        a_tag = page.find("a", lambda a, title=title: a.attrs.get("title") == title)
+        if a_tag is not None and a_tag.attrs.get("href"):
+            href_found = urljoin(link, a_tag.attrs["href"]).replace(ADFOCUS_PREFIX, "")
+            break
+
+    return stripped_title, href_found
+
+
+def process_links_http(hrefs, checkpoint: Checkpoint = None):
+    """
+    Processes all links concurrently with the http engine.
+
+    Args:
+        hrefs (list): The URLs to process.
+        checkpoint (Checkpoint, optional): Journal of the links processed by an interrupted run.
+
+    Returns:
+        list: The (stripped title, href URL) of every link, in the same order as the links.
+    """
+    function = process_link_http
+    if checkpoint:
+        function = checkpoint.wrap(function, complete=all)
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        return list(executor.map(function, hrefs))
+
+
+def has_installer(mc_version: str, forge_version: str) -> bool:
+    """
+    Checks whether a forge build ships an installer jar.
+
+    Args:
+        mc_version (str): The minecraft version of the build (e.g. 1.20.1).
+        forge_version (str): The forge version of the build (e.g. 47.2.0).
+
+    Returns:
+        bool: True if the build is not older than FIRST_INSTALLER_BUILD.
+    """
+    first_mc_version, _, first_forge_version = FIRST_INSTALLER_BUILD.partition("-")
+    if version_key(mc_version) != version_key(first_mc_version):
+        return version_key(mc_version) > version_key(first_mc_version)
+
+    return version_key(forge_version) >= version_key(first_forge_version)
+
+
+def iter_maven_builds(chunks):
+    """
+    Stream-parses the maven metadata and yields every listed build without building the whole tree.
+
+    Args:
+        chunks (iterable): The chunks of the maven-metadata.xml document.
+
+    Yields:
+        str: The builds (e.g. 1.20.1-47.2.0).
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    # Finished elements are removed from their parent, so the tree never holds more than the current path
+    parents = []
+
+    def read_builds():
+        for event, element in parser.read_events():
+            if event == "start":
+                parents.append(element)
+                continue
+
+            parents.pop()
+            if element.tag == "version" and element.text:
+                yield element.text.strip()
+            if parents:
+                parents[-1].remove(element)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from read_builds()
+
+    parser.close()
+    yield from read_builds()
+
+
+def fetch_maven_build_index():
+    """
+    Fetches all forge builds from the maven metadata and groups them by minecraft version.
+
+    Returns:
+        dict: Minecraft versions (newest first) mapped to the installer URLs of all
+              their builds (newest first), empty if the metadata can't be fetched.
+              Builds without an installer are left out.
+    """
+    try:
+        response, chunks = client.stream(url=MAVEN_METADATA_URL, timeout=60)
+    except Exception as e:
+        print(f"Error fetching {MAVEN_METADATA_URL}: {e}")
+        return {}
+
+    if response.status_code != 200:
+        print(f"Error fetching {MAVEN_METADATA_URL}: {response.status_code}")
+        return {}
+
+    builds_per_version = {}
+    without_installer = 0
+    try:
+        for build in iter_maven_builds(chunks):
+            mc_version, _, forge_version = build.partition("-")
+            if not forge_version:
+                continue
+            if not has_installer(mc_version, forge_version):
+                without_installer += 1
+                continue
+            builds_per_version.setdefault(mc_version, []).append(
+                (forge_version, build)
+            )
+    except Exception as e:
+        print(f"Error reading {MAVEN_METADATA_URL}: {e}")
+        return {}
+
+    print(
+        f"Found {sum(len(builds) for builds in builds_per_version.values())} builds for {len(builds_per_version)} minecraft versions in the maven metadata, skipped {without_installer} builds without an installer."
+    )
+
+    build_index = {}
+    for mc_version in sorted(builds_per_version, key=version_key, reverse=True):
+        builds = sorted(
+            builds_per_version[mc_version],
+            key=lambda build: version_key(build[0]),
+            reverse=True,
+        )
+        build_index[mc_version] = {
+            forge_version: INSTALLER_URL_TEMP.format(maven_url=MAVEN_URL, build=build)
+            for forge_version, build in builds
+        }
+
+    return build_index
+
+
+def fetch_hrefs(driver):
+    """
+    Fetches all href links from the main page and strips from adfocus link.
+
+    Args:
+        driver (webdriver.Firefox): The WebDriver instance.
+
+    Returns:
+        list: A list of cleaned href URLs.
+    """
+    load_page(driver, FORGE_INDEX_URL)
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.CLASS_NAME, "li-version-list"))
+    )
+
+    li_version_list_elements = driver.find_elements(By.CLASS_NAME, "li-version-list")
+    print(f"Found {len(li_version_list_elements)} 'li-version-list' elements.")
+
+    hrefs = []
+    for element in li_version_list_elements:
+        ul_element = element.find_element(By.CSS_SELECTOR, "ul.nav-collapsible")
+        li_elements = ul_element.find_elements(By.CSS_SELECTOR, "li:not([class])")
+
+        for li in li_elements:
+            a_tag = li.find_element(By.TAG_NAME, "a")
+            href = a_tag.get_attribute("href")
+            href = href.replace(ADFOCUS_PREFIX, "")
+            hrefs.append(href)
+
+    return hrefs
+
+
+def process_link(driver, link):
+    """
+    Processes each link, retrieves the title, and finds the appropriate download link.
+
+    Args:
+        driver (webdriver.Firefox): The WebDriver instance.
+        link (str): The URL to process.
+
+    Returns:
+        str: The stripped title.
+        str: The found href URL.
+    """
+    try:
+        load_page(driver, link)
+
+        title_element = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located(
+                (By.XPATH, "/html/body/main/div[2]/div[1]/div[2]/h1")
+            )
+        )
+
+        title_text = title_element.text
+        stripped_title = title_text.replace(TITLE_PREFIX, "").strip()
+
+        href_found = None
+        for title in DOWNLOAD_TITLES:
+            try:
+                a_tag = driver.find_element(By.XPATH, f"//a[@title='{title}']")
+                href_found = a_tag.get_attribute("href")
+                href_found = href_found.replace(ADFOCUS_PREFIX, "")
+                break
+            except Exception:
+                continue
+
+        return stripped_title, href_found
+
+    except Exception as e:
+        print(f"Error processing link {link}: {e}")
+        return None, None
+
+
+def fetch_hrefs_selenium():
+    """
+    Fetches all href links from the main page with a browser which is closed afterwards.
+
+    Returns:
+        list: A list of cleaned href URLs.
+    """
+    driver = initialize_driver()
+    try:
+        return fetch_hrefs(driver)
+    finally:
+        driver.quit()
+
+
+def process_links_selenium(hrefs, checkpoint: Checkpoint = None):
+    """
+    Processes all links with a pool of headless browsers.
+
+    Args:
+        hrefs (list): The URLs to process.
+        checkpoint (Checkpoint, optional): Journal of the links processed by an interrupted run.
+
+    Returns:
+        list: The (stripped title, href URL) of every link, in the same order as the links.
+    """
+    function = process_link
+    if checkpoint:
+        function = checkpoint.wrap(function, complete=all)
+
+    pool = WebDriverPool(initialize_driver, workers=WEBDRIVER_WORKERS)
+    return pool.map(function, hrefs, default=(None, None))
+
+
+def crawl_pages(checkpoint: Checkpoint = None):
+    """
+    Reads the download page of every version with the configured engine.
+
+    Args:
+        checkpoint (Checkpoint, optional): Journal of the pages processed by an interrupted run.
+
+    Returns:
+        tuple: The page URLs and the (stripped title, href URL) of every page, in the same order.
+    """
+    if ENGINE == "selenium":
+        hrefs = fetch_hrefs_selenium()
+        return hrefs, process_links_selenium(hrefs, checkpoint)
+
+    hrefs = fetch_hrefs_http()
+    results = process_links_http(hrefs, checkpoint)
+
+    failed_links = [
+        index
+        for index, (stripped_title, href_found) in enumerate(results)
+        if not stripped_title or not href_found
+    ]
+    if SELENIUM_FALLBACK and (failed_links or not hrefs):
+        print(f"Retrying {len(failed_links)} links with selenium.")
+        if not hrefs:
+            hrefs = fetch_hrefs_selenium()
+            results = [(None, None)] * len(hrefs)
+            failed_links = list(range(len(hrefs)))
+        retried_results = process_links_selenium(
+            [hrefs[index] for index in failed_links], checkpoint
+        )
+        for index, result in zip(failed_links, retried_results):
+            results[index] = result
+
+    return hrefs, results
+
+
+def main():
+    """Main which executes everything."""
+    result_dict = {}
+    hrefs = []
+    results = []
+    checkpoint = Checkpoint("forge") if RESUMABLE_CRAWL and ENGINE != "maven" else None
+    build_index = (
+        fetch_maven_build_index() if WRITE_BUILD_INDEX or ENGINE == "maven" else {}
+    )
+
+    if ENGINE == "maven":
+        for mc_version, builds in build_index.items():
+            result_dict[mc_version] = next(iter(builds.values()))
+    else:
+        hrefs, results = crawl_pages(checkpoint)
+
+    if not (build_index if ENGINE == "maven" else hrefs):
+        raise RuntimeError("The forge builds are not available, nothing was crawled")
+
+    # Pages which couldn't be read are listed by their URL so they can be retried,
+    # their version keeps the download link of the previous run
+    previous_links = load_json(OUTPUT_FILENAME)
+    failed_links = []
+    if ENGINE == "maven":
+        # Versions missing in the maven metadata keep the download link of the previous run
+        for mc_version, link in previous_links.items():
+            if mc_version not in result_dict:
+                failed_links.append(mc_version)
+                result_dict[mc_version] = link
+    for href, (stripped_title, href_found) in zip(hrefs, results):
+        if stripped_title and href_found:
+            result_dict[stripped_title] = href_found
+            continue
+
+        failed_links.append(href)
+        page_version = re.search(r"index_(.+)\.html$", href)
+        if page_version and page_version.group(1) in previous_links:
+            result_dict[page_version.group(1)] = previous_links[page_version.group(1)]
+
+    save_to_json(result_dict, OUTPUT_FILENAME)
+    save_failed_keys(failed_links, OUTPUT_FILENAME)
+    if WRITE_BUILD_INDEX and build_index:
+        save_to_json(build_index, BUILD_INDEX_FILENAME)
+    if checkpoint:
+        checkpoint.finish()
+    print_page_load_stats()
+    client.print_stats()
+
+
+class ForgeCrawler(Crawler):
+    """Forge installers from the download pages or the maven repository."""
+
+    name = "forge"
+    clients = (client,)
+
+    def crawl(self):
+        main()
+
+
+if __name__ == "__main__":
+    main()
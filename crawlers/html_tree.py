@@ -0,0 +1,132 @@
+"""Lightweight HTML tree to read static pages without a browser."""
+
+from html.parser import HTMLParser
+
+# Elements which never have an end tag
+VOID_ELEMENTS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "source",
+    "track",
+    "wbr",
+}
+
+
+class Node:
+    """A single element of the parsed page."""
+
+    def __init__(self, tag: str, attrs: dict, parent=None):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children = []
+
+    def has_class(self, class_name: str) -> bool:
+        """
+        Checks if the element has the given class.
+
+        Args:
+            class_name (str): The class to look for.
+
+        Returns:
+            bool: True if the class attribute contains the class.
+        """
+        return class_name in (self.attrs.get("class") or "").split()
+
+    def iter(self, tag: str = None):
+        """
+        Iterates over all descendant elements in document order.
+
+        Args:
+            tag (str, optional): Only yield elements with this tag.
+
+        Yields:
+            Node: The matching descendant elements.
+        """
+        for child in self.children:
+            if isinstance(child, Node):
+                if tag is None or child.tag == tag:
+                    yield child
+                yield from child.iter(tag)
+
+    def find(self, tag: str, predicate=None):
+        """
+        Returns the first descendant element with the tag matching the predicate.
+
+        Args:
+            tag (str): The tag to look for.
+            predicate (callable, optional): Additional check the element has to pass.
+
+        Returns:
+            Node: The element or None if there is none.
+        """
+        return next(
+            (node for node in self.iter(tag) if predicate is None or predicate(node)),
+            None,
+        )
+
+    def text(self) -> str:
+        """
+        Returns the text content with whitespace collapsed like a browser renders it.
+
+        Returns:
+            str: The text of the element and its descendants.
+        """
+        parts = []
+        for child in self.children:
+            parts.append(child.text() if isinstance(child, Node) else child)
+
+        return " ".join("".join(parts).split())
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document", {})
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, {name: value or "" for name, value in attrs}, self.current)
+        self.current.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        node = Node(tag, {name: value or "" for name, value in attrs}, self.current)
+        self.current.children.append(node)
+
+    def handle_endtag(self, tag):
+        # Close everything up to the matching element, ignore stray end tags
+        node = self.current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+
+def parse_html(markup: str) -> Node:
+    """
+    Parses HTML markup into a tree.
+
+    Args:
+        markup (str): The HTML of the page.
+
+    Returns:
+        Node: The document root.
+    """
+    builder = _TreeBuilder()
+    builder.feed(markup)
+    builder.close()
+
+    return builder.root
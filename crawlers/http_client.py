@@ -0,0 +1,760 @@
+"""Shared HTTP layer of the crawlers with pooling, rate limiting, retries and a response cache."""
+
+# pylint: disable=C0301,R0902,R0913
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+# Directory the responses are cached in, shared by all crawlers
+CACHE_DIR = ".http_cache"
+# Cached responses older than this are evicted
+CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+# Oldest cached responses are evicted once the cache grows bigger than this
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Amount of connections kept open per host, shared by all crawlers of one process
+POOL_SIZE = 32
+
+# Requests per second a host starts with, raised while its responses are healthy
+INITIAL_RATE = 5.0
+# Requests per second a host is never slowed down below or sped up above
+MIN_RATE = 0.2
+MAX_RATE = 20.0
+# Requests per second added after every healthy response
+RATE_INCREASE = 0.5
+# Amount of requests a host may receive at once after being idle
+BURST = 5
+# Hosts which should never receive more requests per second than given here
+HOST_MAX_RATES = {"files.mcjars.app": 2.0}
+# Status codes telling us to slow down
+THROTTLE_STATUS_CODES = (429, 503)
+# Status codes of errors which usually go away when the request is sent again
+TRANSIENT_STATUS_CODES = (500, 502, 504)
+# How often a throttled or failed request is sent again after backing off
+MAX_RETRIES = 4
+# Upper bound of the first backoff, doubled on every retry and capped at BACKOFF_MAX_SECONDS
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+# Consecutive requests failing after all their retries after which a host is not contacted
+# for CIRCUIT_OPEN_SECONDS, requests to it wait until a single probe request shows it recovered
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_OPEN_SECONDS = 60.0
+# Requests failing after all their retries a client may have before it stops sending requests at all
+FAILURE_BUDGET = 25
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host which still failed after its circuit cooled down."""
+
+
+class FailureBudgetExceeded(requests.RequestException):
+    """Raised instead of sending a request once a client had too many failed requests."""
+
+
+def backoff_seconds(attempt: int) -> float:
+    """
+    Returns how long to wait before sending a failed request again, with full jitter.
+
+    Args:
+        attempt (int): The number of the failed attempt, starting at 0.
+
+    Returns:
+        float: Seconds to wait.
+    """
+    return random.uniform(
+        0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+    )
+
+
+def parse_retry_after(value: str):
+    """
+    Parses a Retry-After header.
+
+    Args:
+        value (str): The header value, either seconds or a HTTP date.
+
+    Returns:
+        float: Seconds to wait or None if there is no valid value.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Token bucket per host which backs off on 429/503 and speeds up again on healthy responses."""
+
+    def __init__(
+        self,
+        *,
+        initial_rate: float = INITIAL_RATE,
+        min_rate: float = MIN_RATE,
+        max_rate: float = MAX_RATE,
+        rate_increase: float = RATE_INCREASE,
+        burst: int = BURST,
+        host_max_rates: dict = None,
+    ):
+        """
+        Creates the rate limiter.
+
+        Args:
+            initial_rate (float): Requests per second a host starts with.
+            min_rate (float): Lowest requests per second after backing off.
+            max_rate (float): Highest requests per second after speeding up.
+            rate_increase (float): Requests per second added after a healthy response.
+            burst (int): Size of the token bucket.
+            host_max_rates (dict): Lower maximum rates of specific hosts.
+        """
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_increase = rate_increase
+        self.burst = burst
+        self.host_max_rates = HOST_MAX_RATES if host_max_rates is None else host_max_rates
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str) -> dict:
+        if host not in self._buckets:
+            max_rate = min(self.max_rate, self.host_max_rates.get(host, self.max_rate))
+            self._buckets[host] = {
+                "rate": min(self.initial_rate, max_rate),
+                "max_rate": max_rate,
+                "tokens": float(self.burst),
+                "updated": time.monotonic(),
+                "blocked_until": 0.0,
+            }
+
+        return self._buckets[host]
+
+    def acquire(self, url: str):
+        """
+        Blocks until a request to the host of the URL may be sent.
+
+        Args:
+            url (str): The URL which is going to be requested.
+        """
+        host = urlsplit(url).netloc
+        while True:
+            with self._lock:
+                bucket = self._bucket(host)
+                now = time.monotonic()
+                bucket["tokens"] = min(
+                    self.burst,
+                    bucket["tokens"] + (now - bucket["updated"]) * bucket["rate"],
+                )
+                bucket["updated"] = now
+
+                if now < bucket["blocked_until"]:
+                    wait = bucket["blocked_until"] - now
+                elif bucket["tokens"] >= 1:
+                    bucket["tokens"] -= 1
+                    return
+                else:
+                    wait = (1 - bucket["tokens"]) / bucket["rate"]
+
+            time.sleep(wait)
+
+    def record(self, url: str, status_code: int, retry_after: str = None):
+        """
+        Adjusts the rate of the host of the URL to the response it sent.
+
+        Args:
+            url (str): The requested URL.
+            status_code (int): The status code of the response.
+            retry_after (str, optional): The Retry-After header of the response.
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._bucket(host)
+            if status_code in THROTTLE_STATUS_CODES:
+                bucket["rate"] = max(self.min_rate, bucket["rate"] / 2)
+                bucket["tokens"] = 0.0
+                wait = parse_retry_after(retry_after)
+                if wait is None:
+                    wait = 1 / bucket["rate"]
+                bucket["blocked_until"] = max(
+                    bucket["blocked_until"], time.monotonic() + wait
+                )
+            else:
+                bucket["rate"] = min(
+                    bucket["max_rate"], bucket["rate"] + self.rate_increase
+                )
+
+    def rates(self) -> dict:
+        """
+        Returns the current rate of every host.
+
+        Returns:
+            dict: Hosts mapped to their requests per second.
+        """
+        with self._lock:
+            return {host: bucket["rate"] for host, bucket in self._buckets.items()}
+
+
+# Shared by every client so all crawlers in one process respect the same limits
+rate_limiter = RateLimiter()
+
+
+class CircuitBreaker:
+    """
+    Holds back requests to a host after consecutive failures and lets a single one through once it cooled down.
+
+    Requests arriving while the circuit is open wait for the outcome of that probe, so a short outage
+    only delays them. Once a probe failed as well the host is considered down and requests are rejected
+    right away until the next probe succeeds.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS,
+    ):
+        """
+        Creates the circuit breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures which open the circuit of a host.
+            open_seconds (float): How long an open circuit rejects requests.
+        """
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self._circuits = {}
+        self._condition = threading.Condition()
+
+    def _circuit(self, host: str) -> dict:
+        if host not in self._circuits:
+            self._circuits[host] = {
+                "failures": 0,
+                "open_until": 0.0,
+                "probing": False,
+                "probe_failed": False,
+            }
+
+        return self._circuits[host]
+
+    def allow(self, url: str) -> bool:
+        """
+        Waits until a request to the host of the URL may be sent.
+
+        Args:
+            url (str): The URL which is going to be requested.
+
+        Returns:
+            bool: True if the request is the probe of a cooled down circuit, its outcome has to be recorded.
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open and its last probe failed.
+        """
+        host = urlsplit(url).netloc
+        with self._condition:
+            while True:
+                circuit = self._circuit(host)
+                if circuit["failures"] < self.failure_threshold:
+                    return False
+
+                now = time.monotonic()
+                if circuit["probing"]:
+                    self._condition.wait()
+                elif now >= circuit["open_until"]:
+                    # Once cooled down a single request probes whether the host recovered
+                    circuit["probing"] = True
+                    return True
+                elif circuit["probe_failed"]:
+                    raise CircuitOpenError(
+                        f"Circuit of {host} is open, not requesting {url}"
+                    )
+                else:
+                    self._condition.wait(circuit["open_until"] - now)
+
+    def record(self, url: str, failed: bool, probe: bool = False):
+        """
+        Records the outcome of a request to the host of the URL, after all its retries.
+
+        Args:
+            url (str): The requested URL.
+            failed (bool): Whether the request failed.
+            probe (bool): Whether the request was the probe of a cooled down circuit.
+        """
+        host = urlsplit(url).netloc
+        with self._condition:
+            circuit = self._circuit(host)
+            if probe:
+                circuit["probing"] = False
+
+            if not failed:
+                circuit.update(failures=0, probe_failed=False)
+            else:
+                circuit["failures"] += 1
+                if probe or circuit["failures"] == self.failure_threshold:
+                    circuit["probe_failed"] = probe
+                    circuit["open_until"] = time.monotonic() + self.open_seconds
+
+            self._condition.notify_all()
+
+    def open_hosts(self) -> list:
+        """
+        Returns the hosts whose circuit is currently open.
+
+        Returns:
+            list: The hosts.
+        """
+        with self._condition:
+            return [
+                host
+                for host, circuit in self._circuits.items()
+                if circuit["failures"] >= self.failure_threshold
+            ]
+
+
+# Shared by every client so a failing host is skipped by all crawlers of the process
+circuit_breaker = CircuitBreaker()
+
+
+def create_session(pool_size: int = POOL_SIZE) -> requests.Session:
+    """
+    Creates a session which keeps its connections alive and pools them per host.
+
+    Args:
+        pool_size (int): The amount of connections kept open per host.
+
+    Returns:
+        requests.Session: The session, can be shared by several clients.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+_shared_session = None  # pylint: disable=C0103
+_shared_session_lock = threading.Lock()
+
+
+def shared_session() -> requests.Session:
+    """
+    Returns the session shared by all clients of this process, created on first use.
+
+    Returns:
+        requests.Session: The pooled session.
+    """
+    global _shared_session  # pylint: disable=W0603
+
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+
+        return _shared_session
+
+
+class HttpClient:
+    """Pooled HTTP client which revalidates cached responses with ETag and Last-Modified."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        cache_dir: str = CACHE_DIR,
+        max_age_seconds: int = CACHE_MAX_AGE_SECONDS,
+        max_bytes: int = CACHE_MAX_BYTES,
+        limiter: RateLimiter = None,
+        session: requests.Session = None,
+        breaker: CircuitBreaker = None,
+        failure_budget: int = FAILURE_BUDGET,
+    ):
+        """
+        Creates the client and evicts outdated cache entries.
+
+        Args:
+            name (str): Name of the crawler using the client, used for the counters.
+            cache_dir (str): Directory to cache responses in, None disables the cache.
+            max_age_seconds (int): Maximum age of a cached response.
+            max_bytes (int): Maximum total size of the cache.
+            limiter (RateLimiter, optional): Rate limiter to use instead of the shared one.
+            session (requests.Session, optional): Session to use instead of the one shared by the process.
+            breaker (CircuitBreaker, optional): Circuit breaker to use instead of the shared one.
+            failure_budget (int): Failed requests after which the client stops sending requests.
+        """
+        self.name = name
+        self.cache_dir = cache_dir
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self.limiter = limiter or rate_limiter
+        self.breaker = breaker or circuit_breaker
+        self.failure_budget = failure_budget
+        self.counters = {
+            "hits": 0,
+            "misses": 0,
+            "uncached": 0,
+            "throttled": 0,
+            "retried": 0,
+            "failed": 0,
+        }
+        self._lock = threading.Lock()
+
+        self.session = session or shared_session()
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.evict()
+
+    def _count(self, counter: str):
+        with self._lock:
+            self.counters[counter] += 1
+
+    def _cache_paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.json", f"{base}.body"
+
+    def _load_meta(self, url: str):
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            with open(file=meta_path, mode="r", encoding="utf-8") as meta_file:
+                meta = json.load(meta_file)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if meta.get("url") != url or not os.path.exists(body_path):
+            return None
+
+        return meta
+
+    def _load_entry(self, url: str):
+        meta = self._load_meta(url)
+        if meta is None:
+            return None, None
+
+        try:
+            with open(file=self._cache_paths(url)[1], mode="rb") as body_file:
+                body = body_file.read()
+        except OSError:
+            return None, None
+
+        return meta, body
+
+    @staticmethod
+    def _write_cache_file(path: str, mode: str, write):
+        # Write to a temporary file first so concurrent readers never see half an entry
+        temporary_path = f"{path}.{threading.get_ident()}.tmp"
+        encoding = None if "b" in mode else "utf-8"
+        try:
+            with open(file=temporary_path, mode=mode, encoding=encoding) as cache_file:
+                write(cache_file)
+            os.replace(temporary_path, path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def _store_meta(self, url: str, response: requests.Response):
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "encoding": response.encoding,
+            "stored_at": time.time(),
+        }
+        self._write_cache_file(
+            self._cache_paths(url)[0],
+            "w",
+            lambda cache_file: cache_file.write(json.dumps(meta)),
+        )
+
+    def _store_entry(self, url: str, response: requests.Response):
+        self._write_cache_file(
+            self._cache_paths(url)[1],
+            "wb",
+            lambda cache_file: cache_file.write(response.content),
+        )
+        self._store_meta(url, response)
+
+    def _stream_into_cache(
+        self, url: str, response: requests.Response, chunk_size: int
+    ):
+        # The entry is only stored once the whole body was read
+        body_path = self._cache_paths(url)[1]
+        temporary_path = f"{body_path}.{threading.get_ident()}.tmp"
+        try:
+            with open(file=temporary_path, mode="wb") as cache_file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    cache_file.write(chunk)
+                    yield chunk
+            os.replace(temporary_path, body_path)
+            self._store_meta(url, response)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def _read_cached_body(self, url: str, chunk_size: int):
+        with open(file=self._cache_paths(url)[1], mode="rb") as body_file:
+            yield from iter(lambda: body_file.read(chunk_size), b"")
+
+    @staticmethod
+    def _conditional_headers(meta: dict, headers: dict = None) -> dict:
+        headers = dict(headers or {})
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        return headers
+
+    def _touch_entry(self, url: str):
+        for path in self._cache_paths(url):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+    def _send(self, url: str, method: str = "GET", **kwargs) -> requests.Response:
+        failures = self.failure_count()
+        if failures >= self.failure_budget:
+            raise FailureBudgetExceeded(
+                f"{self.name} had {failures} failed requests, not requesting {url}"
+            )
+        # Rejected requests never reached the host, so they neither count as failures of it nor of the budget
+        probe = self.breaker.allow(url)
+
+        # The breaker and the budget see one outcome per request, not one per attempt
+        host_failed = True
+        try:
+            response = self._send_with_retries(url, method, **kwargs)
+            host_failed = response.status_code in TRANSIENT_STATUS_CODES
+            if host_failed or response.status_code in THROTTLE_STATUS_CODES:
+                self._count("failed")
+            return response
+        except (requests.ConnectionError, requests.Timeout):
+            self._count("failed")
+            raise
+        finally:
+            self.breaker.record(url, failed=host_failed, probe=probe)
+
+    def _send_with_retries(
+        self, url: str, method: str, **kwargs
+    ) -> requests.Response:
+        for attempt in range(MAX_RETRIES + 1):
+            self.limiter.acquire(url)
+
+            try:
+                response = self.session.request(method=method, url=url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exception:
+                if attempt == MAX_RETRIES:
+                    raise
+                print(f"{url} failed ({type(exception).__name__}), retrying.")
+                self._count("retried")
+                time.sleep(backoff_seconds(attempt))
+                continue
+
+            self.limiter.record(
+                url, response.status_code, response.headers.get("Retry-After")
+            )
+            failed = response.status_code in TRANSIENT_STATUS_CODES
+
+            if response.status_code in THROTTLE_STATUS_CODES:
+                # The rate limiter already delays the next request to the host
+                self._count("throttled")
+            elif not failed:
+                return response
+
+            if attempt == MAX_RETRIES:
+                return response
+
+            print(f"{url} answered {response.status_code}, retrying.")
+            self._count("retried")
+            # Releases the connection of a streamed response
+            response.close()
+            if failed:
+                time.sleep(backoff_seconds(attempt))
+
+        return response
+
+    def get(self, url: str, timeout: int = 120, **kwargs) -> requests.Response:
+        """
+        Sends a GET request, revalidating a cached response if there is one.
+
+        Args:
+            url (str): The URL to request.
+            timeout (int): Timeout of the request in seconds.
+
+        Returns:
+            requests.Response: The response, rebuilt from the cache if the server
+                               answered with 304 Not Modified.
+        """
+        if not self.cache_dir:
+            self._count("uncached")
+            return self._send(url, timeout=timeout, **kwargs)
+
+        meta, body = self._load_entry(url)
+        headers = self._conditional_headers(meta, kwargs.pop("headers", None))
+        response = self._send(url, timeout=timeout, headers=headers, **kwargs)
+
+        if response.status_code == 304 and meta:
+            self._count("hits")
+            self._touch_entry(url)
+            response.status_code = 200
+            response._content = body  # pylint: disable=W0212
+            response._content_consumed = True  # pylint: disable=W0212
+            response.encoding = meta.get("encoding")
+            if meta.get("content_type"):
+                response.headers["Content-Type"] = meta["content_type"]
+            return response
+
+        if response.status_code == 200 and (
+            response.headers.get("ETag") or response.headers.get("Last-Modified")
+        ):
+            self._count("misses")
+            self._store_entry(url, response)
+        else:
+            self._count("uncached")
+
+        return response
+
+    def stream(
+        self, url: str, timeout: int = 120, chunk_size: int = 64 * 1024, **kwargs
+    ) -> tuple[requests.Response, object]:
+        """
+        Sends a GET request and reads the body chunk by chunk, so it is never held in memory at once.
+
+        A cached body is revalidated like with get and read from the cache chunk by chunk,
+        a new body is written to the cache while it is read.
+
+        Args:
+            url (str): The URL to request.
+            timeout (int): Timeout of the request in seconds.
+            chunk_size (int): Size of the chunks in bytes.
+
+        Returns:
+            tuple[requests.Response, iterable]: The response, with status 200 if the server answered
+                                                with 304 Not Modified, and the chunks of its body.
+        """
+        if not self.cache_dir:
+            self._count("uncached")
+            response = self._send(url, timeout=timeout, stream=True, **kwargs)
+            return response, response.iter_content(chunk_size=chunk_size)
+
+        meta = self._load_meta(url)
+        headers = self._conditional_headers(meta, kwargs.pop("headers", None))
+        response = self._send(
+            url, timeout=timeout, headers=headers, stream=True, **kwargs
+        )
+
+        if response.status_code == 304 and meta:
+            self._count("hits")
+            self._touch_entry(url)
+            response.close()
+            response.status_code = 200
+            return response, self._read_cached_body(url, chunk_size)
+
+        if response.status_code == 200 and (
+            response.headers.get("ETag") or response.headers.get("Last-Modified")
+        ):
+            self._count("misses")
+            return response, self._stream_into_cache(url, response, chunk_size)
+
+        self._count("uncached")
+        return response, response.iter_content(chunk_size=chunk_size)
+
+    def head(self, url: str, timeout: int = 120, **kwargs) -> requests.Response:
+        """
+        Sends a HEAD request, which is never cached.
+
+        Args:
+            url (str): The URL to request.
+            timeout (int): Timeout of the request in seconds.
+
+        Returns:
+            requests.Response: The response.
+        """
+        self._count("uncached")
+        return self._send(url, method="HEAD", timeout=timeout, **kwargs)
+
+    def evict(self):
+        """Removes cache entries which are too old and the oldest ones if the cache is too big."""
+        now = time.time()
+        entries = []
+
+        for file_name in os.listdir(self.cache_dir):
+            if not file_name.endswith(".json"):
+                continue
+            meta_path = os.path.join(self.cache_dir, file_name)
+            body_path = f"{meta_path[:-len('.json')]}.body"
+            try:
+                stat = os.stat(meta_path)
+                size = stat.st_size + os.path.getsize(body_path)
+            except OSError:
+                size = None
+
+            if size is None or now - stat.st_mtime > self.max_age_seconds:
+                self._remove_files(meta_path, body_path)
+                continue
+
+            entries.append((stat.st_mtime, size, meta_path, body_path))
+
+        total_size = sum(entry[1] for entry in entries)
+        for _, size, meta_path, body_path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            self._remove_files(meta_path, body_path)
+            total_size -= size
+
+    @staticmethod
+    def _remove_files(*paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def request_count(self) -> int:
+        """
+        Returns the amount of requests sent by the client, not counting resent ones.
+
+        Returns:
+            int: The amount of requests.
+        """
+        with self._lock:
+            return (
+                self.counters["hits"]
+                + self.counters["misses"]
+                + self.counters["uncached"]
+            )
+
+    def failure_count(self) -> int:
+        """
+        Returns the amount of requests which still failed after all retries.
+
+        Returns:
+            int: The amount of failed requests.
+        """
+        with self._lock:
+            return self.counters["failed"]
+
+    def print_stats(self):
+        """Prints the cache hit and miss counters of the crawler, the current rates and open circuits."""
+        print(
+            f"HTTP cache for {self.name}: {self.counters['hits']} hits (304), {self.counters['misses']} misses, {self.counters['uncached']} uncached, {self.counters['throttled']} throttled, {self.counters['retried']} retried, {self.counters['failed']} failed"
+        )
+        for host, rate in self.limiter.rates().items():
+            print(f"- {host}: {rate:.1f} requests/s")
+        for host in self.breaker.open_hosts():
+            print(f"- {host}: circuit open")
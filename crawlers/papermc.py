@@ -0,0 +1,292 @@
+"""Simple script to get all papermc server jar direct download links."""
+
+# pylint: disable=C0301,W0718,W0719
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .base import Crawler, fetch_json, load_json, save_failed_keys, save_to_json
+from .compact_format import compact_urls, save_compact
+from .http_client import HttpClient
+
+# The PaperMC projects to crawl, every project gets its own output file
+PROJECT_TYPES = ["paper", "folia", "velocity", "waterfall", "travertine"]
+BASE_URL_TEMPLATE = "https://api.papermc.io/v2/projects/{project}/"
+# Download urls usually follow this pattern, used for the compact output
+DOWNLOAD_URL_TEMPLATE = f"{BASE_URL_TEMPLATE}versions/{{version}}/builds/{{build}}/downloads/{{project}}-{{version}}-{{build}}.jar"
+
+# Set to False to request the builds of every version one by one instead of per version group
+BATCHED_FETCH = True
+# Maximum amount of requests running at the same time, shared by all projects
+MAX_PARALLEL_REQUESTS = 8
+# Timeout of every single request in seconds
+REQUEST_TIMEOUT_SECONDS = 60
+
+client = HttpClient("papermc")
+request_slots = threading.BoundedSemaphore(MAX_PARALLEL_REQUESTS)
+
+
+def base_url(project: str) -> str:
+    """Method to get the API url of a project
+
+    Args:
+        project (str): The PaperMC project (e.g. paper or velocity)
+
+    Returns:
+        str: The API url of the project
+    """
+    return BASE_URL_TEMPLATE.format(project=project)
+
+
+def output_filename(project: str) -> str:
+    """Method to get the name of the output file of a project
+
+    Args:
+        project (str): The PaperMC project (e.g. paper or velocity)
+
+    Returns:
+        str: The file name, paper keeps its original paper_downloads.json
+    """
+    return f"{project}_downloads.json"
+
+
+def get_json(url: str):
+    """Method to fetch a json document while respecting the maximum amount of parallel requests
+
+    Args:
+        url (str): The url to request
+
+    Returns:
+        dict: The parsed json or None if it can't be fetched
+    """
+    with request_slots:
+        return fetch_json(client, url, REQUEST_TIMEOUT_SECONDS)
+
+
+def fetch_versions(project: str) -> dict:
+    """Method to get all available versions
+
+    Args:
+        project (str): The PaperMC project
+
+    Raises:
+        Exception: Error if versions can't be fetched
+
+    Returns:
+        str: The json string
+    """
+    versions_data = get_json(base_url(project))
+    if versions_data is None:
+        raise Exception(f"Failed to fetch versions of {project}")
+
+    return versions_data
+
+
+def fetch_builds(project: str, version: str) -> str:
+    """Method to get build informations of specific version
+
+    Args:
+        project (str): The PaperMC project
+        version (str): The version to get the builds of
+
+    Returns:
+        str: The json string or None if the informations can't be fetched
+    """
+    return get_json(f"{base_url(project)}versions/{version}/builds/")
+
+
+def fetch_all_builds(project: str, versions: list) -> list:
+    """Method to get the build informations of all versions in parallel
+
+    Args:
+        project (str): The PaperMC project
+        versions (list): The versions to get the builds of
+
+    Returns:
+        list: The json of every version (None if it failed), in the same order as the versions
+    """
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        return list(
+            executor.map(lambda version: fetch_builds(project, version), versions)
+        )
+
+
+def fetch_version_group_builds(project: str, version_group: str):
+    """Method to get the build informations of all versions of a version group (e.g. 1.20)
+
+    Args:
+        project (str): The PaperMC project
+        version_group (str): The version group to get the builds of
+
+    Returns:
+        dict: The json string or None if the informations can't be fetched
+    """
+    return get_json(f"{base_url(project)}version_group/{version_group}/builds")
+
+
+def fetch_all_builds_batched(project: str, versions_data: dict) -> list:
+    """Method to get the build informations of all versions with one request per version group
+
+    Versions missing in the response of their version group are requested one by one.
+
+    Args:
+        project (str): The PaperMC project
+        versions_data (dict): The project json containing the versions and version groups
+
+    Returns:
+        list: The json of every version (None if it failed), in the same order as the versions
+    """
+    versions = versions_data["versions"]
+    version_groups = versions_data.get("version_groups", [])
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        groups_data = list(
+            executor.map(
+                lambda version_group: fetch_version_group_builds(
+                    project, version_group
+                ),
+                version_groups,
+            )
+        )
+
+    builds_per_version = {}
+    for group_data in groups_data:
+        if not group_data:
+            continue
+        for build in group_data.get("builds", []):
+            builds_per_version.setdefault(build.get("version"), []).append(build)
+
+    missing_versions = [
+        version for version in versions if version not in builds_per_version
+    ]
+    print(
+        f"Fetched builds of {len(version_groups)} {project} version groups, {len(missing_versions)} versions are fetched one by one."
+    )
+    for version, builds_data in zip(
+        missing_versions, fetch_all_builds(project, missing_versions)
+    ):
+        builds_per_version[version] = builds_data and builds_data.get("builds", [])
+
+    return [
+        (
+            None
+            if builds_per_version[version] is None
+            else {"builds": builds_per_version[version]}
+        )
+        for version in versions
+    ]
+
+
+# Generate download links for the latest (highest) build of each version
+def generate_download_links(project: str) -> tuple[dict, list]:
+    """This method simply creates the json to write to the output file
+
+    Args:
+        project (str): The PaperMC project
+
+    Returns:
+        tuple[dict, list]: All versions with one direct download link and the versions whose builds couldn't be fetched,
+                           those keep their link of the previous run
+    """
+    versions_data = fetch_versions(project)
+    versions = versions_data["versions"]
+    previous_links = load_json(output_filename(project))
+    download_links = {}
+    failed_versions = []
+
+    if BATCHED_FETCH:
+        all_builds_data = fetch_all_builds_batched(project, versions_data)
+    else:
+        all_builds_data = fetch_all_builds(project, versions)
+
+    for version, builds_data in zip(versions, all_builds_data):
+        print(f"{project} version: {version}")
+        if builds_data is None:
+            failed_versions.append(version)
+            if version in previous_links:
+                download_links[version] = previous_links[version]
+            continue
+
+        builds = builds_data.get("builds", [])
+        if isinstance(builds, list) and builds:
+
+            latest_build = max(builds, key=lambda b: b["build"])
+
+            build_number = latest_build["build"]
+            file_name = latest_build["downloads"]["application"]["name"]
+
+            download_url = f"{base_url(project)}versions/{version}/builds/{build_number}/downloads/{file_name}"
+            download_links[version] = download_url
+        else:
+            print(
+                f"No builds found for {project} version {version} or 'builds' is not a list."
+            )
+
+    return download_links, failed_versions
+
+
+def crawl_project(project: str) -> tuple[str, bool]:
+    """Method to crawl one project and write its output file
+
+    Args:
+        project (str): The PaperMC project
+
+    Returns:
+        tuple[str, bool]: Summary line of the project with its timing and whether the project failed
+    """
+    start = time.perf_counter()
+    try:
+        download_links, failed_versions = generate_download_links(project)
+        save_to_json(data=download_links, filename=output_filename(project))
+        save_failed_keys(failed_versions, output_filename(project))
+        save_compact(
+            compact_urls(download_links, DOWNLOAD_URL_TEMPLATE),
+            output_filename(project),
+        )
+        result = f"{len(download_links)} versions saved to {output_filename(project)}"
+        if failed_versions:
+            result += f", {len(failed_versions)} failed"
+        failed = False
+
+    except Exception as e:
+        print(f"An error occurred while crawling {project}: {e}")
+        result = f"failed ({e})"
+        failed = True
+
+    return f"{project}: {result} in {time.perf_counter() - start:.2f}s", failed
+
+
+def main():
+    """Main which executes everything."""
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=len(PROJECT_TYPES)) as executor:
+        results = list(executor.map(crawl_project, PROJECT_TYPES))
+
+    print("Summary:")
+    for summary, _ in results:
+        print(f"- {summary}")
+    print(f"Crawled {len(PROJECT_TYPES)} projects in {time.perf_counter() - start:.2f}s")
+
+    client.print_stats()
+
+    # The other projects are written already, the error only marks the crawl as failed
+    failed_projects = [
+        project for project, (_, failed) in zip(PROJECT_TYPES, results) if failed
+    ]
+    if failed_projects:
+        raise Exception(f"Crawling {', '.join(failed_projects)} failed")
+
+
+class PaperCrawler(Crawler):
+    """Builds of every papermc project."""
+
+    name = "paper"
+    clients = (client,)
+
+    def crawl(self):
+        main()
+
+
+if __name__ == "__main__":
+    main()
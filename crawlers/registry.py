@@ -0,0 +1,20 @@
+"""All crawlers of the package keyed by the name of their source."""
+
+from .fabric import FabricCrawler
+from .forge import ForgeCrawler
+from .papermc import PaperCrawler
+from .spigot import SpigotCrawler
+from .sponge import SpongeCrawler
+from .vanilla import VanillaCrawler
+
+CRAWLERS = {
+    crawler.name: crawler
+    for crawler in (
+        VanillaCrawler,
+        PaperCrawler,
+        FabricCrawler,
+        SpongeCrawler,
+        ForgeCrawler,
+        SpigotCrawler,
+    )
+}
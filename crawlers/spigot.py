@@ -0,0 +1,581 @@
+"""Simple script to get all Spigot server jar direct download links."""
+
+# pylint: disable=C0301,W0718
+
+import hashlib
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from .base import (
+    Crawler,
+    fetch_response,
+    load_json,
+    save_failed_keys,
+    save_to_json,
+)
+from .checkpoint import Checkpoint
+from .html_tree import parse_html
+from .http_client import HttpClient
+from .webdriver_pool import (
+    WebDriverPool,
+    apply_lean_profile,
+    load_page,
+    print_page_load_stats,
+)
+
+try:
+    from webdriver_manager.firefox import GeckoDriverManager
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+except ImportError:
+    webdriver = None
+
+
+BASE_URL = "https://files.mcjars.app/spigot/"
+OUTPUT_FILENAME = "spigot_downloads.json"
+DIRECTORY_WAIT_SECONDS = 30
+# "http" parses the directory listings directly, "selenium" renders them in headless Firefox
+ENGINE = "http"
+# Maximum amount of listings requested at the same time by the http engine
+MAX_PARALLEL_REQUESTS = 4
+# Amount of headless browsers reading build listings at the same time
+WEBDRIVER_WORKERS = 4
+# Set to False to read the build listings of every version on every run
+INCREMENTAL_CRAWL = True
+# Previous builds and listing fingerprints of every version
+STATE_FILENAME = "spigot_state.json"
+# Amount of newest version lines (e.g. 1.21) whose build listings are read on every run
+LIVE_VERSION_LINES = 2
+# Days after which the build listings of all other versions are read again
+FULL_RECHECK_DAYS = 14
+# Set to False to not journal the refreshed versions, an interrupted crawl then starts over
+RESUMABLE_CRAWL = True
+
+client = HttpClient("spigot")
+
+
+def initialize_driver():
+    """
+    Initialize the WebDriver with options.
+
+    Returns:
+        webdriver.Firefox: The initialized WebDriver.
+    """
+    if webdriver is None:
+        print("Selenium and webdriver-manager need to be installed to use the browser.")
+        sys.exit(1)
+
+    try:
+        options = webdriver.FirefoxOptions()
+        options.add_argument("--headless")
+
+        options.add_argument("--no-sandbox")
+        apply_lean_profile(options)
+        driver = webdriver.Firefox(
+            service=FirefoxService(GeckoDriverManager().install()), options=options
+        )
+        return driver
+    except Exception as e:
+        print(f"Error initializing the WebDriver: {e}")
+        sys.exit(1)
+
+
+def directory_entries(anchors):
+    """
+    Filters the anchors of a directory listing down to its subdirectories.
+
+    Args:
+        anchors (list[tuple[str, str]]): (text, href) of every listing anchor.
+
+    Returns:
+        list[tuple[str, str]]: (directory name, href) pairs in listing order.
+    """
+    entries = []
+    for text, href in anchors:
+        text = text.strip()
+        if not text or text == "[Parent Directory]":
+            continue
+        if not text.endswith("/"):
+            continue
+        entries.append((text.rstrip("/"), href))
+
+    return entries
+
+
+def latest_build_number(entries):
+    """Return the highest numeric build directory of the listing entries."""
+    build_numbers = [int(name) for name, _ in entries if name.isdigit()]
+    if not build_numbers:
+        return None
+
+    return str(max(build_numbers))
+
+
+def listing_validator(response):
+    """Return the ETag of a listing response, its Last-Modified if there is no ETag, None if it has neither."""
+    return response.headers.get("ETag") or response.headers.get("Last-Modified")
+
+
+def fetch_listing_http(url):
+    """
+    Fetch a directory listing over plain HTTP and parse its anchors.
+
+    Args:
+        url (str): The URL of the directory.
+
+    Returns:
+        list[tuple[str, str]]: (directory name, href) pairs or None if the listing can't be fetched.
+    """
+    entries, _ = fetch_listing_with_validator_http(url)
+    return entries
+
+
+def fetch_listing_with_validator_http(url):
+    """
+    Fetch a directory listing over plain HTTP and parse its anchors.
+
+    Args:
+        url (str): The URL of the directory.
+
+    Returns:
+        tuple: (directory name, href) pairs of the listing and its validator (see listing_validator),
+               None for both if the listing can't be fetched.
+    """
+    response = fetch_response(client, url, DIRECTORY_WAIT_SECONDS)
+    if response is None:
+        return None, None
+
+    anchors = []
+    for table in parse_html(response.text).iter("table"):
+        for row in table.iter("tr"):
+            for cell in row.iter("td"):
+                for anchor in cell.iter("a"):
+                    anchors.append(
+                        (anchor.text(), urljoin(url, anchor.attrs.get("href", "")))
+                    )
+
+    return directory_entries(anchors), listing_validator(response)
+
+
+def fetch_versions_http():
+    """
+    Fetch all available Spigot versions listed on the main page over plain HTTP.
+
+    Returns:
+        list[tuple[str, str]]: (version, version_url) pairs in listing order.
+    """
+    entries = fetch_listing_http(BASE_URL)
+    if entries is None:
+        print("Failed to fetch the Spigot versions directory listing.")
+        return []
+
+    return entries
+
+
+def fetch_latest_build_number_http(version_url):
+    """Return the highest numeric build directory available for the version over plain HTTP."""
+    entries = fetch_listing_http(version_url)
+    if entries is None:
+        return None
+
+    return latest_build_number(entries)
+
+
+def listing_fingerprint(entries) -> str:
+    """Return a fingerprint of the directory names of a listing."""
+    names = "\n".join(sorted(name for name, _ in entries))
+    return hashlib.sha1(names.encode("utf-8")).hexdigest()
+
+
+def version_line(version: str) -> tuple:
+    """Return the version line of a version, e.g. (1, 21) for 1.21.4."""
+    return tuple(int(part) for part in re.findall(r"\d+", version)[:2])
+
+
+def load_state(filename: str) -> dict:
+    """
+    Load the state of the previous run.
+
+    Args:
+        filename (str): The name of the state file.
+
+    Returns:
+        dict: The top-level listing fingerprint and the known versions, empty if there is no state yet.
+    """
+    state = load_json(filename)
+    state.setdefault("listing_fingerprint", None)
+    state.setdefault("versions", {})
+    return state
+
+
+def fetch_build_listing_http(version_url):
+    """
+    Read the build listing of a version.
+
+    Args:
+        version_url (str): The URL of the version directory.
+
+    Returns:
+        tuple: The latest build, the fingerprint and the validator of the listing, None for all if it can't be fetched.
+    """
+    entries, validator = fetch_listing_with_validator_http(version_url)
+    if entries is None:
+        return None, None, None
+
+    return latest_build_number(entries), listing_fingerprint(entries), validator
+
+
+def listing_unchanged(version_url, validator) -> bool:
+    """
+    Check with a HEAD request on the version directory whether its listing is unchanged.
+
+    mcjars numbers the builds with the global spigot build counter, so the next build of a
+    version can't be guessed and the validator of the directory is compared instead.
+
+    Args:
+        version_url (str): The URL of the version directory.
+        validator (str): The validator the listing had when it was read last.
+
+    Returns:
+        bool: True if the directory still has the same validator, False if it changed or the probe failed.
+    """
+    try:
+        response = client.head(url=version_url, timeout=DIRECTORY_WAIT_SECONDS)
+    except Exception as e:
+        print(f"Error probing {version_url}: {e}")
+        return False
+
+    return response.status_code == 200 and listing_validator(response) == validator
+
+
+def needs_listing(version, known, live_lines, now) -> bool:
+    """
+    Check whether the build listing of a version has to be read without probing it first.
+
+    Args:
+        version (str): The version.
+        known (dict): The version in the state of the previous run, None if it is new.
+        live_lines (set): The newest version lines, read on every run.
+        now (int): Unix time of the run.
+
+    Returns:
+        bool: True for new versions, versions without a build or validator, the newest version lines
+              and versions not checked for FULL_RECHECK_DAYS.
+    """
+    if not known or not known.get("build") or not known.get("validator"):
+        return True
+    if version_line(version) in live_lines:
+        return True
+
+    return now - known.get("checked_at", 0) > FULL_RECHECK_DAYS * 24 * 60 * 60
+
+
+def probe_versions(to_probe, state, checkpoint: Checkpoint = None):
+    """
+    Probe the versions whose listing may be unchanged concurrently.
+
+    Args:
+        to_probe (list[tuple[str, str]]): (version, version_url) pairs of the versions to probe.
+        state (dict): The state of the previous run.
+        checkpoint (Checkpoint, optional): Journal every unchanged version is appended to.
+
+    Returns:
+        list[tuple[str, str]]: (version, version_url) pairs whose listing changed or couldn't be probed.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        probes = list(
+            executor.map(
+                lambda item: listing_unchanged(
+                    item[1], state["versions"][item[0]]["validator"]
+                ),
+                to_probe,
+            )
+        )
+
+    changed = []
+    for (version, version_url), unchanged in zip(to_probe, probes):
+        if not unchanged:
+            changed.append((version, version_url))
+        elif checkpoint:
+            checkpoint.record(version, dict(state["versions"][version], url=version_url))
+
+    return changed
+
+
+def list_versions(to_list, now, checkpoint: Checkpoint = None):
+    """
+    Read the build listings of the versions concurrently.
+
+    Args:
+        to_list (list[tuple[str, str]]): (version, version_url) pairs of the versions to list.
+        now (int): Unix time of the run.
+        checkpoint (Checkpoint, optional): Journal every listed version is appended to.
+
+    Returns:
+        dict: The state entry of every version whose listing could be read.
+    """
+
+    def list_builds(item):
+        version, version_url = item
+        build, build_fingerprint, validator = fetch_build_listing_http(version_url)
+        if build_fingerprint is None:
+            return None
+
+        entry = {
+            "url": version_url,
+            "build": build,
+            "fingerprint": build_fingerprint,
+            "validator": validator,
+            "checked_at": now,
+        }
+        if checkpoint:
+            checkpoint.record(version, entry)
+        return entry
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        entries = list(executor.map(list_builds, to_list))
+
+    return {
+        version: entry
+        for (version, _), entry in zip(to_list, entries)
+        if entry is not None
+    }
+
+
+def refresh_state_http(versions, state, checkpoint: Checkpoint = None):
+    """
+    Refresh the known builds, only reading the build listings which may have changed.
+
+    The newest version lines, unknown versions and versions not checked for
+    FULL_RECHECK_DAYS get their build listing read, all of them if the top-level
+    listing changed. The other versions are only re-listed if a HEAD request on their
+    directory returns another ETag (or Last-Modified) than the listing had last time,
+    versions whose listing had neither are always re-listed.
+
+    Args:
+        versions (list[tuple[str, str]]): (version, version_url) pairs in listing order.
+        state (dict): The state of the previous run.
+        checkpoint (Checkpoint, optional): Journal of the versions refreshed by an interrupted run,
+            every refreshed version is appended to it.
+
+    Returns:
+        dict: The refreshed state.
+    """
+    fingerprint = listing_fingerprint(versions)
+    listing_changed = fingerprint != state["listing_fingerprint"]
+    live_lines = sorted({version_line(version) for version, _ in versions}, reverse=True)
+    live_lines = set(live_lines[:LIVE_VERSION_LINES])
+    now = int(time.time())
+
+    journaled = checkpoint.items if checkpoint else {}
+    to_list = []
+    to_probe = []
+    for version, version_url in versions:
+        if version in journaled:
+            continue
+        if listing_changed or needs_listing(
+            version, state["versions"].get(version), live_lines, now
+        ):
+            to_list.append((version, version_url))
+        else:
+            to_probe.append((version, version_url))
+
+    changed = probe_versions(to_probe, state, checkpoint)
+    print(
+        f"Reading {len(to_list) + len(changed)} build listings, {len(to_probe) - len(changed)} unchanged listings confirmed by HEAD requests."
+    )
+    listed = list_versions(to_list + changed, now, checkpoint)
+
+    refreshed_versions = {}
+    for version, version_url in versions:
+        if version in journaled:
+            refreshed_versions[version] = journaled[version]
+        elif version in listed:
+            refreshed_versions[version] = listed[version]
+        elif version in state["versions"]:
+            refreshed_versions[version] = dict(state["versions"][version], url=version_url)
+
+    return {"listing_fingerprint": fingerprint, "versions": refreshed_versions}
+
+
+def fetch_latest_build_numbers_http(version_urls, checkpoint: Checkpoint = None):
+    """
+    Fetch the build listings of all versions concurrently.
+
+    Args:
+        version_urls (list[str]): The URLs of the version directories.
+        checkpoint (Checkpoint, optional): Journal of the versions fetched by an interrupted run.
+
+    Returns:
+        list: The latest build of every version, in the same order as the URLs.
+    """
+    function = fetch_latest_build_number_http
+    if checkpoint:
+        function = checkpoint.wrap(function, complete=lambda build: build is not None)
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        return list(executor.map(function, version_urls))
+
+
+def wait_for_directory_listing(driver, timeout: int = DIRECTORY_WAIT_SECONDS) -> bool:
+    """Wait for the directory listing table to be present."""
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "table tr td a"))
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def fetch_versions(driver):
+    """
+    Fetch all available Spigot versions listed on the main page.
+
+    Args:
+        driver (webdriver.Firefox): The WebDriver instance.
+
+    Returns:
+        list[tuple[str, str]]: (version, version_url) pairs in listing order.
+    """
+    load_page(driver, BASE_URL)
+    if not wait_for_directory_listing(driver):
+        print("Timed out waiting for the Spigot versions directory listing.")
+        return []
+
+    return directory_entries(
+        (anchor.text, anchor.get_attribute("href"))
+        for anchor in driver.find_elements(By.CSS_SELECTOR, "table tr td a")
+    )
+
+
+def fetch_latest_build_number(driver, version_url):
+    """Return the highest numeric build directory available for the version."""
+    load_page(driver, version_url)
+    if not wait_for_directory_listing(driver):
+        print(f"Timed out waiting for build listings at {version_url}")
+        return None
+
+    return latest_build_number(
+        directory_entries(
+            (anchor.text, anchor.get_attribute("href"))
+            for anchor in driver.find_elements(By.CSS_SELECTOR, "table tr td a")
+        )
+    )
+
+
+def fetch_latest_build_numbers(version_urls, checkpoint: Checkpoint = None):
+    """
+    Fetch the build listings of all versions with the pool of headless browsers.
+
+    Args:
+        version_urls (list[str]): The URLs of the version directories.
+        checkpoint (Checkpoint, optional): Journal of the versions fetched by an interrupted run.
+
+    Returns:
+        list: The latest build of every version, in the same order as the URLs.
+    """
+    function = fetch_latest_build_number
+    if checkpoint:
+        function = checkpoint.wrap(function, complete=lambda build: build is not None)
+
+    pool = WebDriverPool(initialize_driver, workers=WEBDRIVER_WORKERS)
+    return pool.map(function, version_urls)
+
+
+def download_links(versions, latest_builds, failed_versions, state=None):
+    """
+    Build the server.jar link of the latest build of every version.
+
+    Versions whose listing couldn't be read keep the download link of the previous run.
+
+    Args:
+        versions (list[tuple[str, str]]): (version, version_url) pairs in listing order.
+        latest_builds (list): The latest build of every version, None if it is unknown.
+        failed_versions (list): The versions whose listing failed, versions without a build are
+            appended to it if there is no state to tell a failed listing apart from an empty one.
+        state (dict, optional): The refreshed state of the incremental crawl.
+
+    Returns:
+        dict: The server.jar link of every version.
+    """
+    result_dict = {}
+    previous_links = load_json(OUTPUT_FILENAME)
+    for (version, version_url), latest_build in zip(versions, latest_builds):
+        if not latest_build:
+            print(f"No build directories found for version {version}.")
+            if state is None:
+                failed_versions.append(version)
+            if version in failed_versions and version in previous_links:
+                result_dict[version] = previous_links[version]
+            continue
+
+        result_dict[version] = urljoin(version_url, f"{latest_build}/server.jar")
+        print(f"Latest build for {version}: {latest_build}")
+
+    return result_dict
+
+
+def main():
+    """Main which executes everything."""
+    failed_versions = []
+
+    if ENGINE == "selenium":
+        driver = initialize_driver()
+        try:
+            versions = fetch_versions(driver)
+        finally:
+            driver.quit()
+    else:
+        versions = fetch_versions_http()
+    print(f"Found {len(versions)} Spigot version directories.")
+    if not versions:
+        raise RuntimeError("The version listing is not available, nothing was crawled")
+
+    version_urls = [version_url for _, version_url in versions]
+    state = None
+    checkpoint = Checkpoint("spigot") if RESUMABLE_CRAWL else None
+    if ENGINE != "selenium" and INCREMENTAL_CRAWL:
+        state = refresh_state_http(versions, load_state(STATE_FILENAME), checkpoint)
+        latest_builds = [
+            state["versions"].get(version, {}).get("build") for version, _ in versions
+        ]
+        # Versions whose listing failed and which no earlier run knows are missing in the state
+        failed_versions = [
+            version for version, _ in versions if version not in state["versions"]
+        ]
+    elif ENGINE == "selenium":
+        latest_builds = fetch_latest_build_numbers(version_urls, checkpoint)
+    else:
+        latest_builds = fetch_latest_build_numbers_http(version_urls, checkpoint)
+
+    result_dict = download_links(versions, latest_builds, failed_versions, state)
+
+    save_to_json(result_dict, OUTPUT_FILENAME)
+    save_failed_keys(failed_versions, OUTPUT_FILENAME)
+    if state:
+        save_to_json(state, STATE_FILENAME)
+    if checkpoint:
+        checkpoint.finish()
+    print_page_load_stats()
+    client.print_stats()
+
+
+class SpigotCrawler(Crawler):
+    """Latest spigot build of every version from the mcjars mirror."""
+
+    name = "spigot"
+    clients = (client,)
+
+    def crawl(self):
+        main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+"""Simple script to get all sponge server jar direct download links."""
+
+# pylint: disable=C0301,W0718
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .base import (
+    Crawler,
+    fetch_json,
+    load_json,
+    save_failed_keys,
+    save_to_json,
+    version_key,
+)
+from .checkpoint import Checkpoint
+from .http_client import HttpClient
+
+# The sponge artifacts to crawl, every artifact gets its own output file
+SPONGE_ARTIFACTS = ["spongevanilla", "spongeforge"]
+BASE_SPONGE_URL_TEMP = "https://dl-api.spongepowered.org/v2/groups/org.spongepowered/artifacts/{artifact_id}"
+VERSIONS_SPONGE_URL_TEMP = "https://dl-api.spongepowered.org/v2/groups/org.spongepowered/artifacts/{artifact_id}/versions?limit=1&tags=minecraft:{mc_version}"
+# Possible locations of a jar, the first one which exists is used
+DOWNLOAD_URL_CANDIDATES = [
+    "https://repo.spongepowered.org/repository/maven-releases/org/spongepowered/{artifact_id}/{artifact}/{artifact_id}-{artifact}-universal.jar",
+    "https://repo.spongepowered.org/repository/maven-releases/org/spongepowered/{artifact_id}/{artifact}/{artifact_id}-{artifact}.jar",
+    "https://repo.spongepowered.org/repository/legacy-transfer/org/spongepowered/{artifact_id}/{artifact}/{artifact_id}-{artifact}.jar",
+]
+
+# Maximum amount of requests running at the same time per artifact
+MAX_PARALLEL_REQUESTS = 8
+# Amount of newest minecraft versions whose artifact is queried on every run, older ones are cached
+RECENT_VERSIONS = 5
+# Set to False to not journal the queried versions, an interrupted crawl then starts over
+RESUMABLE_CRAWL = True
+
+# One client per artifact for separate request counts, all sharing the connections of the process
+clients = {artifact_id: HttpClient(artifact_id) for artifact_id in SPONGE_ARTIFACTS}
+
+
+def output_filename(artifact_id: str) -> str:
+    """Method to get the name of the output file of an artifact
+
+    Args:
+        artifact_id (str): The sponge artifact (e.g. spongevanilla)
+
+    Returns:
+        str: The file name, spongevanilla keeps its original sponge_downloads.json
+    """
+    if artifact_id == "spongevanilla":
+        return "sponge_downloads.json"
+
+    return f"{artifact_id}_downloads.json"
+
+
+def cache_filename(artifact_id: str) -> str:
+    """Method to get the name of the file caching the resolved artifacts and download urls
+
+    Args:
+        artifact_id (str): The sponge artifact (e.g. spongevanilla)
+
+    Returns:
+        str: The file name
+    """
+    if artifact_id == "spongevanilla":
+        return "sponge_artifact_cache.json"
+
+    return f"{artifact_id}_artifact_cache.json"
+
+
+def load_cache(filename: str) -> dict:
+    """Method to load the artifacts and download urls resolved by previous runs
+
+    Args:
+        filename (str): The name of the cache file
+
+    Returns:
+        dict: Minecraft versions mapped to their artifact and artifacts mapped to their download url
+    """
+    cache = load_json(filename)
+    cache.setdefault("artifacts", {})
+    cache.setdefault("download_urls", {})
+    return cache
+
+
+def filter_versions(minecraft_versions: list[str]) -> list[str]:
+    """Method to filter out all base versions
+
+    Args:
+        minecraft_versions (list[str]): A list of minecraft versions
+
+    Returns:
+        list[str]: A list of minecraft versions but filtered of base versions
+    """
+    return [version for version in minecraft_versions if version.count(".") > 1]
+
+
+def fetch_artifact(artifact_id: str, mc_version: str) -> tuple[str, bool]:
+    """Method to get the newest artifact of a minecraft version
+
+    Args:
+        artifact_id (str): The sponge artifact (e.g. spongevanilla)
+        mc_version (str): The respective minecraft version
+
+    Returns:
+        tuple[str, bool]: The artifact string or None if there is none and whether the query failed
+    """
+    versions_url = VERSIONS_SPONGE_URL_TEMP.format(
+        artifact_id=artifact_id, mc_version=mc_version
+    )
+    version_data = fetch_json(clients[artifact_id], versions_url)
+
+    if version_data is None:
+        return None, True
+
+    if "artifacts" in version_data:
+        return next(iter(version_data["artifacts"].keys()), None), False
+
+    return None, False
+
+
+def url_exists(client: HttpClient, url: str) -> bool:
+    """Method to check with a HEAD request if a file exists
+
+    Args:
+        client (HttpClient): The client of the crawled artifact
+        url (str): The url of the file
+
+    Returns:
+        bool: True if the file exists, None if the probe failed
+    """
+    try:
+        response = client.head(url=url, timeout=60)
+    except Exception as e:
+        print(f"Error probing {url}: {e}")
+        return None
+
+    if response.status_code >= 500:
+        print(f"Error probing {url}: {response.status_code}")
+        return None
+
+    return response.ok
+
+
+def resolve_download_url(artifact_id: str, artifact: str) -> tuple[str, bool]:
+    """Method to find the repository containing the jar of an artifact by probing all candidates at once
+
+    Args:
+        artifact_id (str): The sponge artifact (e.g. spongevanilla)
+        artifact (str): The artifact string
+
+    Returns:
+        tuple[str, bool]: Download url to directly download sponge file or None if no repository has it
+                          and whether a repository couldn't be probed
+    """
+    candidates = [
+        candidate.format(artifact_id=artifact_id, artifact=artifact)
+        for candidate in DOWNLOAD_URL_CANDIDATES
+    ]
+    with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+        existing = list(
+            executor.map(lambda url: url_exists(clients[artifact_id], url), candidates)
+        )
+
+    download_url = next(
+        (candidate for candidate, exists in zip(candidates, existing) if exists), None
+    )
+    return download_url, download_url is None and None in existing
+
+
+def query_artifacts(
+    artifact_id: str, minecraft_versions: list[str], cache: dict, checkpoint: Checkpoint = None
+) -> set:
+    """Method to query the artifacts of the recent and the uncached minecraft versions
+
+    Args:
+        artifact_id (str): The sponge artifact (e.g. spongevanilla)
+        minecraft_versions (list[str]): The minecraft versions of the artifact
+        cache (dict): The resolved artifacts and download urls, updated in place
+        checkpoint (Checkpoint, optional): Journal of the versions queried by an interrupted run
+
+    Returns:
+        set: The minecraft versions whose query failed and which no earlier run resolved
+    """
+    recent_versions = set(
+        sorted(minecraft_versions, key=version_key, reverse=True)[:RECENT_VERSIONS]
+    )
+    versions_to_query = [
+        mc_version
+        for mc_version in minecraft_versions
+        if mc_version in recent_versions or mc_version not in cache["artifacts"]
+    ]
+    print(
+        f"Querying {len(versions_to_query)} of {len(minecraft_versions)} minecraft versions of {artifact_id}, the others are cached."
+    )
+
+    function = fetch_artifact
+    if checkpoint:
+        function = checkpoint.wrap(function, complete=lambda result: not result[1])
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        artifacts = list(
+            executor.map(
+                lambda mc_version: function(artifact_id, mc_version),
+                versions_to_query,
+            )
+        )
+    # A failed query keeps the artifact of an earlier run, versions without one are listed as failed
+    failed_queries = set()
+    for mc_version, (artifact, failed) in zip(versions_to_query, artifacts):
+        if artifact:
+            cache["artifacts"][mc_version] = artifact
+        elif failed and mc_version not in cache["artifacts"]:
+            failed_queries.add(mc_version)
+
+    return failed_queries
+
+
+def resolve_download_urls(
+    artifact_id: str, minecraft_versions: list[str], cache: dict
+) -> set:
+    """Method to resolve the download urls of the artifacts which aren't cached yet
+
+    Args:
+        artifact_id (str): The sponge artifact (e.g. spongevanilla)
+        minecraft_versions (list[str]): The minecraft versions of the artifact
+        cache (dict): The resolved artifacts and download urls, updated in place
+
+    Returns:
+        set: The artifacts whose repositories couldn't be probed
+    """
+    artifacts_to_resolve = sorted(
+        {
+            cache["artifacts"][mc_version]
+            for mc_version in minecraft_versions
+            if mc_version in cache["artifacts"]
+            and cache["artifacts"][mc_version] not in cache["download_urls"]
+        }
+    )
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        download_urls = list(
+            executor.map(
+                lambda artifact: resolve_download_url(artifact_id, artifact),
+                artifacts_to_resolve,
+            )
+        )
+    failed_artifacts = set()
+    for artifact, (download_url, failed) in zip(artifacts_to_resolve, download_urls):
+        if download_url:
+            cache["download_urls"][artifact] = download_url
+        elif failed:
+            failed_artifacts.add(artifact)
+
+    # Only keep the artifacts which are still in use
+    used_artifacts = {
+        cache["artifacts"][mc_version]
+        for mc_version in minecraft_versions
+        if mc_version in cache["artifacts"]
+    }
+    cache["download_urls"] = {
+        artifact: download_url
+        for artifact, download_url in cache["download_urls"].items()
+        if artifact in used_artifacts
+    }
+
+    return failed_artifacts
+
+
+def process_minecraft_versions(artifact_id: str) -> tuple[str, bool]:
+    """Method to process the versions of an artifact and generate the links
+
+    Args:
+        artifact_id (str): The sponge artifact (e.g. spongevanilla)
+
+    Returns:
+        tuple[str, bool]: Summary line of the artifact with its request count and wall time
+                          and whether the artifact failed
+    """
+    start = time.perf_counter()
+    client = clients[artifact_id]
+    sponge_downloads = {}
+    failed_versions = []
+    initial_data = fetch_json(client, BASE_SPONGE_URL_TEMP.format(artifact_id=artifact_id))
+
+    if not initial_data or "tags" not in initial_data:
+        print(f"Error: No 'minecraft' list found in the initial data of {artifact_id}.")
+        return (
+            f"{artifact_id}: failed after {client.request_count()} requests in {time.perf_counter() - start:.2f}s",
+            True,
+        )
+
+    minecraft_versions = filter_versions(initial_data["tags"]["minecraft"])
+    cache = load_cache(cache_filename(artifact_id))
+    checkpoint = Checkpoint(artifact_id) if RESUMABLE_CRAWL else None
+    failed_queries = query_artifacts(artifact_id, minecraft_versions, cache, checkpoint)
+    failed_artifacts = resolve_download_urls(artifact_id, minecraft_versions, cache)
+
+    for mc_version in minecraft_versions:
+        print(f"Processing {artifact_id} mc version: {mc_version}:")
+        artifact = cache["artifacts"].get(mc_version)
+
+        if artifact and artifact in cache["download_urls"]:
+            print(f"- Found artifact {artifact}\n")
+            sponge_downloads[mc_version] = cache["download_urls"][artifact]
+        elif mc_version in failed_queries or artifact in failed_artifacts:
+            print(f"Error: Could not query {artifact_id} for Minecraft version {mc_version}")
+            failed_versions.append(mc_version)
+        elif artifact:
+            print(f"Error: No repository contains artifact {artifact}")
+        else:
+            print(f"Error: No artifact found for Minecraft version {mc_version}")
+
+    save_to_json(sponge_downloads, output_filename(artifact_id))
+    save_to_json(cache, cache_filename(artifact_id))
+    save_failed_keys(failed_versions, output_filename(artifact_id))
+    if checkpoint:
+        checkpoint.finish()
+
+    return (
+        f"{artifact_id}: {len(sponge_downloads)} versions saved to {output_filename(artifact_id)} ({len(failed_versions)} failed) with {client.request_count()} requests in {time.perf_counter() - start:.2f}s",
+        False,
+    )
+
+
+def main():
+    """Main which executes everything."""
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=len(SPONGE_ARTIFACTS)) as executor:
+        results = list(executor.map(process_minecraft_versions, SPONGE_ARTIFACTS))
+
+    print("Summary:")
+    for summary, _ in results:
+        print(f"- {summary}")
+    print(
+        f"Crawled {len(SPONGE_ARTIFACTS)} artifacts in {time.perf_counter() - start:.2f}s"
+    )
+
+    for client in clients.values():
+        client.print_stats()
+
+    # The other artifacts are written already, the error only marks the crawl as failed
+    failed_artifacts = [
+        artifact_id
+        for artifact_id, (_, failed) in zip(SPONGE_ARTIFACTS, results)
+        if failed
+    ]
+    if failed_artifacts:
+        raise RuntimeError(f"Crawling {', '.join(failed_artifacts)} failed")
+
+
+class SpongeCrawler(Crawler):
+    """SpongeVanilla and SpongeForge artifacts."""
+
+    name = "sponge"
+    clients = tuple(clients.values())
+
+    def crawl(self):
+        main()
+
+
+if __name__ == "__main__":
+    main()
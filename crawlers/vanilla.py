@@ -0,0 +1,277 @@
+"""Simple script to get all vanilla server jar direct download links."""
+
+# pylint: disable=C0301
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from .base import Crawler, fetch_json, load_json, save_failed_keys, save_to_json
+from .checkpoint import Checkpoint
+from .compact_format import compact_urls, save_compact
+from .http_client import HttpClient
+
+MOJANG_MANIFEST_URL = "https://piston-meta.mojang.com/mc/game/version_manifest_v2.json"
+
+# Set to False to query the asset URLs one after another
+CONCURRENT_FETCH = True
+# Maximum amount of requests in flight to a single host at the same time
+MAX_REQUESTS_PER_HOST = 8
+# Set to False to ignore the store and query the metadata of every version again
+INCREMENTAL_CRAWL = True
+# Already resolved versions keyed by the sha1 of their metadata document
+STORE_FILENAME = "vanilla_versions_store.json"
+# Set to False to not journal the resolved versions, an interrupted crawl then starts over
+RESUMABLE_CRAWL = True
+# Patterns of the server jar and asset urls, used for the compact output
+SERVER_URL_TEMPLATE = "https://piston-data.mojang.com/v1/objects/{sha1}/server.jar"
+ASSET_URL_TEMPLATE = "https://piston-meta.mojang.com/v1/packages/{sha1}/{version}.json"
+
+client = HttpClient("vanilla")
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def host_semaphore(url: str) -> threading.Semaphore:
+    """
+    Returns the semaphore limiting the requests in flight to the host of the URL.
+
+    Args:
+        url (str): The URL which is going to be requested.
+
+    Returns:
+        threading.Semaphore: The semaphore of the host.
+    """
+    host = urlsplit(url).netloc
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+
+        return _host_semaphores[host]
+
+
+def resolve_version(
+    version: str, url: str, http_client: HttpClient, sha1s: dict, checkpoint: Checkpoint
+):
+    """
+    Fetches the metadata document of a version and resolves its server URL.
+
+    Args:
+        version (str): The version ID.
+        url (str): The asset URL of the version.
+        http_client (HttpClient): Client to reuse connections and cached responses from.
+        sha1s (dict): The sha1 of the metadata document of each version.
+        checkpoint (Checkpoint): Journal the resolved version is appended to, may be None.
+
+    Returns:
+        dict: The store entry of the version, None if the asset URL failed.
+    """
+    with host_semaphore(url):
+        data_asset = fetch_json(http_client, url)
+    if data_asset is None:
+        return None
+
+    try:
+        server_url = data_asset["downloads"]["server"]["url"]
+    except KeyError:
+        server_url = None
+
+    entry = {"sha1": sha1s.get(version), "server_url": server_url}
+    if checkpoint:
+        checkpoint.record(version, entry)
+
+    return entry
+
+
+def filter_versions(versions):
+    """
+    Filters release and snapshot versions from the version manifest data.
+
+    Args:
+        versions (list): List of version metadata from the manifest.
+
+    Returns:
+        tuple: Two dictionaries:
+               - A dictionary of release versions and their asset URLs.
+               - A dictionary of snapshot versions and their asset URLs.
+    """
+    print("Filtering versions into releases and snapshots:")
+    release_versions = {
+        version.get("id", "Unknown version"): version.get("url", "error")
+        for version in versions
+        if "release" in version.get("type", "error")
+    }
+
+    snapshot_versions = {
+        version.get("id", "Unknown version"): version.get("url", "error")
+        for version in versions
+        if "snapshot" in version.get("type", "error")
+    }
+
+    return release_versions, snapshot_versions
+
+
+def get_server_urls(
+    vanilla_asset_urls,
+    http_client: HttpClient = None,
+    store: dict = None,
+    sha1s: dict = None,
+    checkpoint: Checkpoint = None,
+):
+    """
+    Fetches server URLs from the asset URLs.
+
+    Args:
+        vanilla_asset_urls (dict): A dictionary of version IDs and their asset URLs.
+        http_client (HttpClient, optional): Client to reuse connections and cached responses from,
+            the client of the module if not given.
+        store (dict, optional): Already resolved versions, only versions which are
+            missing or whose sha1 changed get queried. Updated in place.
+        sha1s (dict, optional): The sha1 of the metadata document of each version.
+        checkpoint (Checkpoint, optional): Journal every resolved version is appended to.
+
+    Returns:
+        tuple: Three dictionaries:
+               - Versions with server URLs.
+               - Versions without server URLs.
+               - Versions whose asset URL failed and which were never resolved before.
+    """
+    http_client = http_client or client
+    store = {} if store is None else store
+    sha1s = sha1s or {}
+    versions_with_server = {}
+    versions_without_server = {}
+    failed_versions = {}
+
+    outdated_asset_urls = {
+        version: url
+        for version, url in vanilla_asset_urls.items()
+        if version not in store
+        or not sha1s.get(version)
+        or store[version].get("sha1") != sha1s[version]
+    }
+    print(
+        f"Querying {len(outdated_asset_urls)} of {len(vanilla_asset_urls)} asset URLs to get possible server direct download URLs:"
+    )
+
+    def resolve(item):
+        return resolve_version(item[0], item[1], http_client, sha1s, checkpoint)
+
+    if CONCURRENT_FETCH:
+        with ThreadPoolExecutor(max_workers=MAX_REQUESTS_PER_HOST) as executor:
+            entries = list(executor.map(resolve, outdated_asset_urls.items()))
+    else:
+        entries = map(resolve, outdated_asset_urls.items())
+
+    for version, entry in zip(outdated_asset_urls, entries):
+        # A failed version keeps what an earlier run resolved, its outdated sha1 gets it queried again next time
+        if entry is not None:
+            store[version] = entry
+
+    for version, url in vanilla_asset_urls.items():
+        if version not in store:
+            print(f"Could not query the asset URL of version {version}")
+            failed_versions[version] = url
+            continue
+
+        if store[version]["server_url"]:
+            print(f"There is a server.jar available for version {version}")
+            versions_with_server[version] = store[version]["server_url"]
+        else:
+            print(f"There is no server.jar available for version {version}")
+            versions_without_server[version] = url
+
+    return versions_with_server, versions_without_server, failed_versions
+
+
+def save_compact_downloads(final_data: dict, filename: str):
+    """
+    Saves the compact form of an output file next to it.
+
+    Args:
+        final_data (dict): The versions with and without server of the output file.
+        filename (str): The name of the output file.
+    """
+    compact_data = {
+        "server_available": compact_urls(
+            final_data["server_available"], SERVER_URL_TEMPLATE
+        ),
+        "server_unavailable": compact_urls(
+            final_data["server_unavailable"], ASSET_URL_TEMPLATE
+        ),
+    }
+    save_compact(compact_data, filename)
+
+
+def main():
+    """Main which executes everything."""
+
+    print("Trying to gather all versions available in manifestv2 file:")
+    manifest_data = fetch_json(client, MOJANG_MANIFEST_URL)
+    if manifest_data is None:
+        raise RuntimeError("The version manifest is not available, nothing was crawled")
+
+    all_versions = manifest_data.get("versions", [])
+    releases_asset_urls, snapshots_asset_urls = filter_versions(all_versions)
+
+    store = load_json(STORE_FILENAME) if INCREMENTAL_CRAWL else {}
+    # Versions resolved by an interrupted run are in the journal with the sha1 they were resolved for
+    checkpoint = Checkpoint("vanilla") if RESUMABLE_CRAWL else None
+    if checkpoint:
+        store.update(checkpoint.items)
+    sha1s = {
+        version.get("id", "Unknown version"): version.get("sha1")
+        for version in all_versions
+    }
+
+    (
+        release_versions_with_server,
+        release_versions_without_server,
+        release_versions_failed,
+    ) = get_server_urls(releases_asset_urls, client, store, sha1s, checkpoint)
+    (
+        snapshot_versions_with_server,
+        snapshot_versions_without_server,
+        snapshot_versions_failed,
+    ) = get_server_urls(snapshots_asset_urls, client, store, sha1s, checkpoint)
+
+    final_data_release = {
+        "server_available": release_versions_with_server,
+        "server_unavailable": release_versions_without_server,
+    }
+
+    final_data_snapshot = {
+        "server_available": snapshot_versions_with_server,
+        "server_unavailable": snapshot_versions_without_server,
+    }
+
+    save_to_json(final_data_release, "release_vanilla_downloads.json")
+    save_to_json(final_data_snapshot, "snapshot_vanilla_downloads.json")
+    save_failed_keys(release_versions_failed, "release_vanilla_downloads.json")
+    save_failed_keys(snapshot_versions_failed, "snapshot_vanilla_downloads.json")
+
+    save_compact_downloads(final_data_release, "release_vanilla_downloads.json")
+    save_compact_downloads(final_data_snapshot, "snapshot_vanilla_downloads.json")
+
+    # Only keep versions which are still listed in the manifest
+    store = {version: store[version] for version in sha1s if version in store}
+    save_to_json(store, STORE_FILENAME)
+    if checkpoint:
+        checkpoint.finish()
+    client.print_stats()
+
+    print("Done, saved release and snapshot urls to their respective files.")
+
+
+class VanillaCrawler(Crawler):
+    """Release and snapshot server jars listed in the mojang version manifest."""
+
+    name = "vanilla"
+    clients = (client,)
+
+    def crawl(self):
+        main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""Pool of reusable WebDriver workers for the crawls which still need a browser."""
+
+# pylint: disable=C0301,W0718
+
+import os
+import queue
+import threading
+import time
+from processes import process_tree_memory_mb
+from .http_client import rate_limiter
+
+# Amount of browsers running at the same time
+WORKERS = os.cpu_count() or 1
+# Upper limit of the memory all browsers together may use
+MAX_BROWSER_MEMORY_MB = 8192
+# Memory a single headless browser needs, used to cap the amount of workers
+DRIVER_MEMORY_ESTIMATE_MB = 512
+# How often a page is retried after its browser crashed
+MAX_RETRIES = 2
+
+# Hosts of ads and analytics which are never loaded by the lean crawl profile
+BLOCKED_HOSTS = [
+    "adfoc.us",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "googletagservices.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+]
+# Firefox preferences of the lean crawl profile, blocking images, fonts and stylesheets
+LEAN_PREFERENCES = {
+    "permissions.default.image": 2,
+    "permissions.default.stylesheet": 2,
+    "gfx.downloadable_fonts.enabled": False,
+    "media.autoplay.default": 5,
+    "browser.cache.disk.enable": False,
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+}
+
+page_load_times = []
+_page_load_times_lock = threading.Lock()
+
+
+def blocked_hosts_pac() -> str:
+    """
+    Builds a proxy auto-config which sends requests to blocked hosts into nowhere.
+
+    Returns:
+        str: The PAC file as data URL.
+    """
+    conditions = " || ".join(
+        f'dnsDomainIs(host, "{host}")' for host in BLOCKED_HOSTS
+    )
+    pac = (
+        "function FindProxyForURL(url, host) {"
+        f' if ({conditions}) return "PROXY 127.0.0.1:9";'
+        ' return "DIRECT"; }'
+    )
+    return f"data:application/x-ns-proxy-autoconfig,{pac}"
+
+
+def apply_lean_profile(options):
+    """
+    Configures Firefox options to only load what the crawls need.
+
+    Images, fonts, stylesheets and ad/analytics hosts are blocked and pages are
+    handed over once the DOM is ready instead of waiting for the full load.
+
+    Args:
+        options (webdriver.FirefoxOptions): The options to configure.
+
+    Returns:
+        webdriver.FirefoxOptions: The configured options.
+    """
+    options.page_load_strategy = "eager"
+    for name, value in LEAN_PREFERENCES.items():
+        options.set_preference(name, value)
+
+    options.set_preference("network.proxy.type", 2)
+    options.set_preference("network.proxy.autoconfig_url", blocked_hosts_pac())
+
+    return options
+
+
+def load_page(driver, url: str) -> float:
+    """
+    Opens a page, respecting the shared rate limit of its host, and records how long it took to load.
+
+    Args:
+        driver (webdriver.Firefox): The WebDriver instance.
+        url (str): The URL to open.
+
+    Returns:
+        float: The load time in seconds.
+    """
+    rate_limiter.acquire(url)
+    start = time.perf_counter()
+    driver.get(url)
+    elapsed = time.perf_counter() - start
+
+    with _page_load_times_lock:
+        page_load_times.append(elapsed)
+    print(f"Loaded {url} in {elapsed:.2f}s")
+
+    return elapsed
+
+
+def print_page_load_stats():
+    """Prints the amount of loaded pages and their load times."""
+    with _page_load_times_lock:
+        times = sorted(page_load_times)
+
+    if not times:
+        return
+
+    print(
+        f"Loaded {len(times)} pages in {sum(times):.2f}s, average {sum(times) / len(times):.2f}s, median {times[len(times) // 2]:.2f}s, slowest {times[-1]:.2f}s"
+    )
+
+
+def driver_memory_mb(driver) -> float:
+    """
+    Returns the memory used by the driver process and the browser started by it.
+
+    Args:
+        driver (webdriver.Firefox): The WebDriver instance.
+
+    Returns:
+        float: The resident memory in MB, 0 if it can't be determined.
+    """
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None:
+        return 0
+
+    return process_tree_memory_mb(process.pid)
+
+
+def is_alive(driver) -> bool:
+    """
+    Checks if the browser of the driver still responds.
+
+    Args:
+        driver (webdriver.Firefox): The WebDriver instance.
+
+    Returns:
+        bool: False if the browser crashed or the session is gone.
+    """
+    try:
+        _ = driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def quit_driver(driver):
+    """
+    Quits the driver and ignores errors of an already crashed browser.
+
+    Args:
+        driver (webdriver.Firefox): The WebDriver instance.
+    """
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class WebDriverPool:  # pylint: disable=R0903
+    """Runs pages through several headless browsers, each reused across pages."""
+
+    def __init__(
+        self,
+        create_driver,
+        workers: int = WORKERS,
+        max_memory_mb: int = MAX_BROWSER_MEMORY_MB,
+        max_retries: int = MAX_RETRIES,
+    ):
+        """
+        Creates the pool, the browsers are started once work arrives.
+
+        Args:
+            create_driver (callable): Function returning a new WebDriver.
+            workers (int): Amount of browsers running at the same time.
+            max_memory_mb (int): Memory all browsers together may use, also caps the workers.
+            max_retries (int): How often a page is retried after its browser crashed.
+        """
+        self.create_driver = create_driver
+        self.workers = max(1, min(workers, max_memory_mb // DRIVER_MEMORY_ESTIMATE_MB))
+        self.memory_per_driver_mb = max_memory_mb / self.workers
+        self.max_retries = max_retries
+
+    def _create(self):
+        try:
+            return self.create_driver()
+        except (Exception, SystemExit) as e:
+            print(f"Error starting a browser worker: {e}")
+            return None
+
+    def _work(self, function, work: queue.Queue, results: list):
+        driver = None
+        try:
+            while True:
+                try:
+                    index, item = work.get_nowait()
+                except queue.Empty:
+                    return
+
+                for attempt in range(self.max_retries + 1):
+                    if driver is None:
+                        driver = self._create()
+                        if driver is None:
+                            # Leave the item to the remaining workers
+                            work.put((index, item))
+                            return
+
+                    try:
+                        results[index] = function(driver, item)
+                        crashed = not is_alive(driver)
+                    except Exception as e:
+                        print(f"Browser worker failed on {item}: {e}")
+                        crashed = True
+
+                    if not crashed:
+                        break
+
+                    print(f"Restarting crashed browser (attempt {attempt + 1}) for {item}")
+                    quit_driver(driver)
+                    driver = None
+
+                if driver is not None and driver_memory_mb(driver) > self.memory_per_driver_mb:
+                    print("Restarting browser as it exceeds its share of the memory limit.")
+                    quit_driver(driver)
+                    driver = None
+        finally:
+            if driver is not None:
+                quit_driver(driver)
+
+    def map(self, function, items: list, default=None) -> list:
+        """
+        Calls function(driver, item) for every item, spread over the browser workers.
+
+        Args:
+            function (callable): Function processing one item with a driver.
+            items (list): The items to process.
+            default (optional): Result of items which couldn't be processed at all.
+
+        Returns:
+            list: The results, in the same order as the items.
+        """
+        results = [default] * len(items)
+        work = queue.Queue()
+        for index, item in enumerate(items):
+            work.put((index, item))
+
+        threads = [
+            threading.Thread(target=self._work, args=(function, work, results))
+            for _ in range(min(self.workers, len(items)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results
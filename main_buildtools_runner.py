@@ -1,177 +1,500 @@
 """Simple script to build all spigot versions using the buildtools for all mc-versions."""
 
-# pylint: disable=C0301,W0621
+# pylint: disable=C0301
 
-import subprocess
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from buildtools import (
+    BuildCache,
+    build_matrix,
+    discover_jdks,
+    file_sha256,
+    match_jdk,
+    print_comparison,
+    run_instrumented,
+    write_run_report,
+)
 
 # Location of the BuildTools.jar file
 BUILDTOOLS_LOCATION = "BuildTools.jar"
+# The targets compiled for every minecraft version
+COMPILE_TYPES = ["craftbukkit", "spigot"]
+# Set to False to start BuildTools once per target instead of compiling all targets in one invocation
+COMBINED_COMPILE = True
+
+# The builds of a java version are split into lanes which run concurrently, every lane runs its builds
+# one after another in its own directory below this one (e.g. java-17/lane-0) with its own BuildTools checkout
+WORK_DIR = "buildtools_work"
+# Set to False to give every lane its own local maven repository instead of sharing one per java version,
+# sharing relies on the file locking of maven 3.9+ (the maven BuildTools downloads)
+SHARED_MAVEN_REPOSITORY = True
+# The compiled jars of all builds are collected in this directory
+OUTPUT_DIR = "buildtools_output"
+# Exit code, duration, resource usage and log of every build are written to this file,
+# the same data is kept per run in buildtools_reports/ and compared with the previous runs
+SUMMARY_FILENAME = "buildtools_summary.json"
+# Set to False to build every version again even if its jars were built before
+BUILD_CACHE = True
+# Built jars are cached here under their content hash, point BUILD_CACHE_DIR to a shared directory (e.g. NFS) to share them between hosts
+BUILD_CACHE_DIR = os.environ.get("BUILD_CACHE_DIR", "buildtools_cache")
+
+# Processor cores and memory the builds may use together, None uses all cores and 3/4 of the memory
+CPU_BUDGET = None
+MEMORY_BUDGET_MB = None
+# Processor cores and maximum heap of a single build, maven gets the same heap
+CPUS_PER_BUILD = 2
+MEMORY_PER_BUILD_MB = 2048
 
 # Command to compile minecraft version
-COMMAND_TEMPLATE = "{java_path} -Xms512M -jar {build_tools} --nogui --compile {compile_type} --rev {version}"
-
-# List of minecraft versions
-versions = [
-    "1.8",
-    "1.8.3",
-    "1.8.4",
-    "1.8.5",
-    "1.8.6",
-    "1.8.7",
-    "1.8.8",
-    "1.9",
-    "1.9.2",
-    "1.9.4",
-    "1.10",
-    "1.10.2",
-    "1.11",
-    "1.11.1",
-    "1.11.2",
-    "1.12",
-    "1.12.1",
-    "1.12.2",
-    "1.13",
-    "1.13.1",
-    "1.13.2",
-    "1.14",
-    "1.14.1",
-    "1.14.2",
-    "1.14.3",
-    "1.14.4",
-    "1.15",
-    "1.15.1",
-    "1.15.2",
-    "1.16.1",
-    "1.16.2",
-    "1.16.3",
-    "1.16.4",
-    "1.16.5",
-    "1.17",
-    "1.17.1",
-    "1.18.1",
-    "1.18.2",
-    "1.19",
-    "1.19.1",
-    "1.19.2",
-    "1.19.3",
-    "1.19.4",
-    "1.20.1",
-    "1.20.2",
-    "1.20.3",
-    "1.20.4",
-    "1.20.5",
-    "1.20.6",
-    "1.21",
-    "1.21.1",
-    "1.21.2",
-    "1.21.3",
-    "1.21.4",
-    "1.21.5",
-]
-
-# Minecraft versions with their respective java runtime version
-java_requirements = {
-    "1.8": "8",
-    "1.8.3": "8",
-    "1.8.4": "8",
-    "1.8.5": "8",
-    "1.8.6": "8",
-    "1.8.7": "8",
-    "1.8.8": "8",
-    "1.9": "8",
-    "1.9.2": "8",
-    "1.9.4": "8",
-    "1.10": "8",
-    "1.10.2": "8",
-    "1.11": "8",
-    "1.11.1": "8",
-    "1.11.2": "8",
-    "1.12": "11",
-    "1.12.1": "11",
-    "1.12.2": "11",
-    "1.13": "11",
-    "1.13.1": "11",
-    "1.13.2": "11",
-    "1.14": "11",
-    "1.14.1": "11",
-    "1.14.2": "11",
-    "1.14.3": "11",
-    "1.14.4": "11",
-    "1.15": "11",
-    "1.15.1": "11",
-    "1.15.2": "11",
-    "1.16.1": "11",
-    "1.16.2": "11",
-    "1.16.3": "11",
-    "1.16.4": "11",
-    "1.16.5": "16",
-    "1.17": "17",
-    "1.17.1": "17",
-    "1.18.1": "17",
-    "1.18.2": "17",
-    "1.19": "17",
-    "1.19.1": "17",
-    "1.19.2": "17",
-    "1.19.3": "17",
-    "1.19.4": "17",
-    "1.20.1": "21",
-    "1.20.2": "21",
-    "1.20.3": "21",
-    "1.20.4": "21",
-    "1.20.5": "21",
-    "1.20.6": "21",
-    "1.21": "21",
-    "1.21.1": "21",
-    "1.21.2": "21",
-    "1.21.3": "21",
-    "1.21.4": "21",
-    "1.21.5": "21",
-}
-
-# Java paths for the versions 8, 11, 16, 17 and 21 which need to be set by you
-java_paths = {
-    "8": "/Library/Java/JavaVirtualMachines/temurin-8.jdk/Contents/Home/bin/java",
-    "11": "/Library/Java/JavaVirtualMachines/microsoft-11.jdk/Contents/Home/bin/java",
-    "16": "/Library/Java/JavaVirtualMachines/temurin-16.jdk/Contents/Home/bin/java",
-    "17": "/Library/Java/JavaVirtualMachines/temurin-17.jdk/Contents/Home/bin/java",
-    "21": "/Library/Java/JavaVirtualMachines/zulu-21.jdk/Contents/Home/bin/java",
-}
-
-
-def run_command(run_command: str):
-    """Method to call subprocess
-
-    Args:
-        command (str): The command to execute
-    """
-    try:
-        print(f"Running command: {run_command}")
-        subprocess.run(run_command, shell=True, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error while building: {e}")
-
-
-for version in versions:
-    required_java_version = java_requirements.get(version)
-
-    if required_java_version and java_paths.get(required_java_version):
-        java_path = java_paths[required_java_version]
+COMMAND_TEMPLATE = "{java_path} -Xms512M -Xmx{memory}M -XX:ActiveProcessorCount={cpus} -jar {build_tools} --nogui --compile {compile_type} --rev {version} --output-dir {output_dir}"
+
+# Minecraft versions to build, None builds every release BuildTools knows
+VERSIONS = None
+# Java executables to use next to the JDKs found in /usr/lib/jvm, SDKMAN, /Library/Java and JAVA_HOME
+EXTRA_JAVA_PATHS = []
+
+
+def total_memory_mb() -> int:
+    """Method to get the physical memory of the machine
+
+    Returns:
+        int: The memory in MB
+    """
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1024 * 1024)
+
+
+def jar_filename(compile_type: str, version: str) -> str:
+    """Method to get the name of the jar BuildTools writes for a target
+
+    Args:
+        compile_type (str): The compiled target (e.g. spigot)
+        version (str): The minecraft version
+
+    Returns:
+        str: The file name (e.g. spigot-1.21.4.jar)
+    """
+    return f"{compile_type}-{version}.jar"
+
+
+def jar_bytes(compile_type: str, version: str) -> int:
+    """Method to get the size of the jars of a build in the output directory
+
+    Args:
+        compile_type (str): The compiled targets, separated by commas
+        version (str): The minecraft version
+
+    Returns:
+        int: The size of all existing jars in bytes
+    """
+    paths = [
+        os.path.join(OUTPUT_DIR, jar_filename(target, version))
+        for target in compile_type.split(",")
+    ]
+    return sum(os.path.getsize(path) for path in paths if os.path.exists(path))
+
+
+def build_workers(cpu_budget: int = None, memory_budget_mb: int = None) -> int:
+    """Method to get the amount of builds which may run at the same time
+
+    Args:
+        cpu_budget (int, optional): Processor cores of all builds, all cores if not given
+        memory_budget_mb (int, optional): Memory of all builds in MB, 3/4 of the memory if not given
+
+    Returns:
+        int: The amount of concurrent builds, at least one
+    """
+    cpu_budget = cpu_budget or os.cpu_count() or 1
+    memory_budget_mb = memory_budget_mb or total_memory_mb() * 3 // 4
+
+    return max(
+        1,
+        min(cpu_budget // CPUS_PER_BUILD, memory_budget_mb // MEMORY_PER_BUILD_MB),
+    )
+
+
+def java_range(min_java: int, max_java: int) -> str:
+    """Method to describe the java versions a build supports
+
+    Args:
+        min_java (int): The oldest supported java version
+        max_java (int): The newest supported java version
+
+    Returns:
+        str: The range (e.g. 8-11 or 21)
+    """
+    return str(min_java) if min_java == max_java else f"{min_java}-{max_java}"
+
+
+def build_plan(matrix: list[dict], jdks: list[dict]) -> list[dict]:
+    """Method to list every build with the newest installed java runtime it supports
+
+    Args:
+        matrix (list[dict]): The minecraft versions with their supported java versions
+        jdks (list[dict]): The installed java runtimes, newest first
+
+    Returns:
+        list[dict]: One build per minecraft version (per compile type without COMBINED_COMPILE), java_path is None if no compatible runtime is installed
+    """
+    compile_types = [",".join(COMPILE_TYPES)] if COMBINED_COMPILE else COMPILE_TYPES
+
+    plan = []
+    for entry in matrix:
+        jdk = match_jdk(jdks, entry["min_java"], entry["max_java"]) or {}
+        for compile_type in compile_types:
+            plan.append(
+                {
+                    "version": entry["version"],
+                    "compile_type": compile_type,
+                    "required_java": java_range(entry["min_java"], entry["max_java"]),
+                    "java_version": str(jdk["major"]) if jdk else None,
+                    "java_path": jdk.get("path"),
+                    "jdk_version": jdk.get("version"),
+                }
+            )
+
+    return plan
+
+
+def print_plan(plan: list[dict], jdks: list[dict]):
+    """Method to print the found java runtimes and the runtime every build is going to use
+
+    Args:
+        plan (list[dict]): The builds from the plan
+        jdks (list[dict]): The installed java runtimes
+    """
+    print(f"Found {len(jdks)} java runtimes:")
+    for jdk in jdks:
+        print(f"- Java V{jdk['major']} ({jdk['version']}): {jdk['path']}")
+
+    print("Build plan:")
+    for build in plan:
+        if build["java_path"]:
+            java = f"Java V{build['java_version']} ({build['jdk_version']})"
+        else:
+            java = "skipped, no compatible Java installed"
         print(
-            f"Trying to build minecraft V{version} with Java V{required_java_version}:"
+            f"- {build['compile_type']} {build['version']} (Java {build['required_java']}): {java}"
         )
 
-        # Command execution
-        for compile_type in ["craftbukkit", "spigot"]:
-            command = COMMAND_TEMPLATE.format(
-                java_path=java_path,
-                build_tools=BUILDTOOLS_LOCATION,
-                compile_type=compile_type,
+
+def split_into_lanes(groups: dict, workers: int) -> list[tuple]:
+    """Method to split the builds of every java version into lanes running concurrently
+
+    The lanes are shared out in proportion to the size of the groups, every group gets at least one lane
+    and the builds are dealt out in turns, so every lane gets old and new versions.
+
+    Args:
+        groups (dict): Java versions mapped to their builds
+        workers (int): The amount of builds which may run at the same time
+
+    Returns:
+        list[tuple]: (java version, lane number, builds) of every lane, the longest first
+    """
+    total_builds = sum(len(builds) for builds in groups.values())
+
+    lanes = []
+    for java_version, builds in groups.items():
+        lane_count = max(1, min(len(builds), workers * len(builds) // max(1, total_builds)))
+        for lane in range(lane_count):
+            lanes.append((java_version, lane, builds[lane::lane_count]))
+
+    return sorted(lanes, key=lambda lane: len(lane[2]), reverse=True)
+
+
+def group_by_java(plan: list[dict]) -> dict:
+    """Method to group the builds which can run by their java version
+
+    Args:
+        plan (list[dict]): The builds from the plan
+
+    Returns:
+        dict: Java versions mapped to their builds
+    """
+    groups = {}
+    for build in plan:
+        if build["java_path"]:
+            groups.setdefault(build["java_version"], []).append(build)
+
+    return groups
+
+
+def skip_build(build: dict) -> dict:
+    """Method to record a build whose java version is not available
+
+    Args:
+        build (dict): The build from the plan
+
+    Returns:
+        dict: The build with its status
+    """
+    print(
+        f"Skipping {build['compile_type']} {build['version']} as no compatible Java version ({build['required_java']}) is available."
+    )
+    return dict(
+        build,
+        status="skipped",
+        exit_code=None,
+        seconds=0.0,
+        cpu_seconds=0.0,
+        peak_rss_mb=0.0,
+        jar_bytes=0,
+        log=None,
+    )
+
+
+def cache_key(build: dict, compile_type: str) -> str:
+    """Method to get the build cache key of one target of a build
+
+    Args:
+        build (dict): The build from the plan
+        compile_type (str): The compiled target (e.g. spigot)
+
+    Returns:
+        str: The key
+    """
+    return BuildCache.key(
+        build["version"], compile_type, build["buildtools_sha256"], build["jdk_version"]
+    )
+
+
+def restore_from_cache(build: dict, cache: BuildCache) -> tuple[dict, str]:
+    """Method to copy the jars of a build from the build cache into the output directory
+
+    Args:
+        build (dict): The build from the plan
+        cache (BuildCache): Cache to take unchanged jars from
+
+    Returns:
+        tuple[dict, str]: The finished build if all its targets were cached (None otherwise)
+                          and the targets which still have to be compiled, separated by commas
+    """
+    version, compile_type = build["version"], build["compile_type"]
+    missing_types = [
+        target
+        for target in compile_type.split(",")
+        if not cache.restore(cache_key(build, target), OUTPUT_DIR)
+    ]
+    if missing_types:
+        return None, ",".join(missing_types)
+
+    print(f"Took {compile_type} {version} from the build cache.")
+    return (
+        dict(
+            build,
+            status="cached",
+            exit_code=None,
+            seconds=0.0,
+            cpu_seconds=0.0,
+            peak_rss_mb=0.0,
+            jar_bytes=jar_bytes(compile_type, version),
+            log=None,
+        ),
+        compile_type,
+    )
+
+
+def store_in_cache(build: dict, compile_type: str, cache: BuildCache):
+    """Method to store the jars of a successful build in the build cache
+
+    Args:
+        build (dict): The build from the plan
+        compile_type (str): The compiled targets, separated by commas
+        cache (BuildCache): Cache to store the built jars in
+    """
+    version = build["version"]
+    for target in compile_type.split(","):
+        jar_path = os.path.join(OUTPUT_DIR, jar_filename(target, version))
+        if os.path.exists(jar_path):
+            cache.store(
+                cache_key(build, target),
+                jar_path,
                 version=version,
+                compile_type=target,
+                buildtools_sha256=build["buildtools_sha256"],
+                jdk_version=build["jdk_version"],
             )
-            run_command(run_command=command)
-    else:
+        else:
+            print(f"BuildTools didn't write {jar_path}, it is not cached.")
+
+
+def run_build(
+    build: dict, work_dir: str, maven_repository: str, cache: BuildCache = None
+) -> dict:
+    """Method to run one build in the work directory of its lane
+
+    Targets whose jar is in the build cache are copied from it instead of being compiled.
+
+    Args:
+        build (dict): The build from the plan
+        work_dir (str): The work directory shared by all builds of the lane
+        maven_repository (str): The local maven repository of the build
+        cache (BuildCache, optional): Cache to take unchanged jars from and to store built jars in
+
+    Returns:
+        dict: The build with its status, exit code, wall and CPU time, peak memory of the
+              JVM process tree, size of its jars and log file
+    """
+    version, compile_type = build["version"], build["compile_type"]
+    if cache and build["jdk_version"]:
+        cached, compile_type = restore_from_cache(build, cache)
+        if cached:
+            return cached
+
+    log_dir = os.path.join(work_dir, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, f"{version}-{compile_type.replace(',', '-')}.log")
+    # The template is split before formatting, so paths with spaces stay one argument
+    command = [
+        part.format(
+            java_path=build["java_path"],
+            memory=MEMORY_PER_BUILD_MB,
+            cpus=CPUS_PER_BUILD,
+            build_tools=os.path.abspath(BUILDTOOLS_LOCATION),
+            compile_type=compile_type,
+            version=version,
+            output_dir=os.path.abspath(OUTPUT_DIR),
+        )
+        for part in COMMAND_TEMPLATE.split()
+    ]
+    # The maven started by BuildTools uses the given local repository, locking it per artifact if it is shared
+    maven_options = f"-Xmx{MEMORY_PER_BUILD_MB}M -Dmaven.repo.local={os.path.abspath(maven_repository)}"
+    if SHARED_MAVEN_REPOSITORY:
+        maven_options += " -Daether.syncContext.named.factory=file-lock -Daether.syncContext.named.nameMapper=file-gav"
+    environment = dict(os.environ, MAVEN_OPTS=maven_options)
+
+    print(
+        f"Building {compile_type} {version} with Java V{build['java_version']}: {' '.join(command)}"
+    )
+    measurement = run_instrumented(command, work_dir, environment, log_path)
+    exit_code = measurement["exit_code"]
+    if exit_code is None:
+        print(f"Error while building {compile_type} {version}, see {log_path}")
+    status = "ok" if exit_code == 0 else "failed"
+
+    if cache and build["jdk_version"] and exit_code == 0:
+        store_in_cache(build, compile_type, cache)
+    print(
+        f"Finished {compile_type} {version}: {status} (exit code {exit_code}) in {measurement['seconds']:.0f}s, "
+        f"{measurement['cpu_seconds']:.0f}s CPU, {measurement['peak_rss_mb']:.0f}MB peak memory"
+    )
+
+    # The size covers all targets of the build, including the ones taken from the cache
+    return dict(
+        build,
+        status=status,
+        **measurement,
+        jar_bytes=jar_bytes(build["compile_type"], version),
+        log=log_path,
+    )
+
+
+def run_lane(
+    java_version: str, lane: int, builds: list[dict], cache: BuildCache = None
+) -> list[dict]:
+    """Method to run the builds of one lane back to back against a warm checkout and maven repository
+
+    Args:
+        java_version (str): The java version of the builds
+        lane (int): The number of the lane within the java version
+        builds (list[dict]): The builds from the plan
+        cache (BuildCache, optional): Cache to take unchanged jars from and to store built jars in
+
+    Returns:
+        list[dict]: The finished builds
+    """
+    java_dir = os.path.join(WORK_DIR, f"java-{java_version}")
+    work_dir = os.path.join(java_dir, f"lane-{lane}")
+    os.makedirs(work_dir, exist_ok=True)
+    maven_repository = os.path.join(
+        java_dir if SHARED_MAVEN_REPOSITORY else work_dir, "maven-repository"
+    )
+    print(f"Running {len(builds)} builds with Java V{java_version} in {work_dir}.")
+
+    return [run_build(build, work_dir, maven_repository, cache) for build in builds]
+
+
+def run_lanes(lanes: list[tuple], workers: int, cache: BuildCache = None) -> dict:
+    """Method to run all lanes with the given amount of builds at the same time
+
+    Args:
+        lanes (list[tuple]): (java version, lane number, builds) of every lane
+        workers (int): The amount of builds which may run at the same time
+        cache (BuildCache, optional): Cache to take unchanged jars from and to store built jars in
+
+    Returns:
+        dict: The finished builds keyed by their version and compile type
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        finished = [executor.submit(run_lane, *lane, cache=cache) for lane in lanes]
+        return {
+            (result["version"], result["compile_type"]): result
+            for lane_results in finished
+            for result in lane_results.result()
+        }
+
+
+def print_summary(results: list[dict]):
+    """Method to print the outcome of every build
+
+    Args:
+        results (list[dict]): The finished builds
+    """
+    print("Summary:")
+    for result in results:
         print(
-            f"Skipping minecraft version {version} as the required Java version ({required_java_version}) is not available."
+            f"- {result['compile_type']} {result['version']}: {result['status']}, exit code {result['exit_code']}, "
+            f"{result['seconds']:.0f}s, {result['cpu_seconds']:.0f}s CPU, {result['peak_rss_mb']:.0f}MB peak memory, "
+            f"{result['jar_bytes'] / (1024 * 1024):.1f}MB jars, log {result['log']}"
         )
 
-print("Whole build process completed.")
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    print(", ".join(f"{count} {status}" for status, count in counts.items()))
+
+
+def main():
+    """Main which executes everything."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    cache = BuildCache(BUILD_CACHE_DIR) if BUILD_CACHE else None
+    buildtools_sha256 = file_sha256(BUILDTOOLS_LOCATION)
+
+    matrix = build_matrix()
+    if VERSIONS is not None:
+        matrix = [entry for entry in matrix if entry["version"] in VERSIONS]
+    jdks = discover_jdks(EXTRA_JAVA_PATHS)
+    plan = build_plan(matrix, jdks)
+    for build in plan:
+        build["buildtools_sha256"] = buildtools_sha256
+    print_plan(plan, jdks)
+
+    groups = group_by_java(plan)
+    workers = build_workers(CPU_BUDGET, MEMORY_BUDGET_MB)
+    lanes = split_into_lanes(groups, workers)
+    print(
+        f"Running {len(plan)} builds in {len(lanes)} lanes of {len(groups)} java versions with {workers} at the same time."
+    )
+
+    started_at = time.time()
+    start = time.perf_counter()
+    results = run_lanes(lanes, workers, cache)
+    results = [
+        results.get((build["version"], build["compile_type"])) or skip_build(build)
+        for build in plan
+    ]
+
+    with open(file=SUMMARY_FILENAME, mode="w", encoding="utf-8") as json_file:
+        json.dump(results, json_file, indent=4)
+
+    print_summary(results)
+    report = write_run_report(results, started_at)
+    print_comparison(report)
+    print(
+        f"Whole build process completed in {time.perf_counter() - start:.0f}s, summary saved to {SUMMARY_FILENAME}."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Measurements of running processes, shared by the crawlers and the build runner."""
+
+# pylint: disable=C0301
+
+import os
+
+
+def process_tree_memory_mb(pid: int) -> float:
+    """
+    Sums up the resident memory of a process and all its descendants (Linux only).
+
+    Args:
+        pid (int): The process id of the root process.
+
+    Returns:
+        float: The resident memory in MB, 0 if it can't be determined.
+    """
+    total_kb = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(file=f"/proc/{current}/status", mode="r", encoding="utf-8") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+
+            for task in os.listdir(f"/proc/{current}/task"):
+                children_path = f"/proc/{current}/task/{task}/children"
+                with open(file=children_path, mode="r", encoding="utf-8") as children:
+                    pending.extend(int(child) for child in children.read().split())
+        except (OSError, ValueError):
+            continue
+
+    return total_kb / 1024